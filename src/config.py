@@ -44,6 +44,16 @@ class Config:
         PASSWORD = os.getenv("RABBITMQ_PASSWORD", "guest")
         SOLVER_DIRECTOR_RESULT_QUEUE = "solver_director_result_queue"
 
+    class Kubernetes:
+        # Enough for every spawner worker thread to keep its own connection
+        CONNECTION_POOL_MAXSIZE = int(os.getenv("K8S_CONNECTION_POOL_MAXSIZE", "100"))
+
+    class ResultCollector:
+        BATCH_SIZE = int(os.getenv("RESULT_BATCH_SIZE", "500"))
+        # Room for a second batch to arrive while the previous one is flushed
+        PREFETCH_COUNT = int(os.getenv("RESULT_PREFETCH_COUNT", "1000"))
+        FLUSH_INTERVAL_SECONDS = float(os.getenv("RESULT_FLUSH_INTERVAL_SECONDS", "0.5"))
+
     class ResourceLimitDefaults:
         PER_USER_CPU_CORES = float(os.getenv("DEFAULT_PER_USER_CPU_CORES", "5.0"))
         PER_USER_MEMORY_GIB = float(os.getenv("DEFAULT_PER_USER_MEMORY_GIB", "8.0"))
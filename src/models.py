@@ -159,6 +159,8 @@ class Project(Base):
     requested_cpu_cores = Column(Float, nullable=False)
     requested_memory_gib = Column(Float, nullable=False)
     is_queued = Column(Boolean, nullable=False, default=False, server_default="false")
+    # Set when the project's services could not be started
+    failure_reason = Column(String, nullable=True)
 
 
 class ProjectResult(Base):
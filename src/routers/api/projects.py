@@ -1,5 +1,5 @@
 from typing import Annotated, Any
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, status
 from src.project_utils.data_streamer import data_streamer
 from sqlalchemy import func
 from sqlalchemy.orm import Session
@@ -13,6 +13,7 @@ import logging
 from src.database import get_db
 from src.models import Project, ResourceDefaults, UserResourceConfig
 from src.spawner.start_service import start_project_services
+from src.spawner.status_service import UserLimitReachedError, is_user_limit_reached
 from src.spawner.stop_service import stop_solver_controller
 from src.spawner.queue_drain import drain_queue
 from src.config import Config
@@ -124,7 +125,7 @@ scopes = [SCOPES["write"]]
 @router.post(
     "/projects",
     response_model=ProjectResponse,
-    status_code=status.HTTP_201_CREATED,
+    status_code=status.HTTP_202_ACCEPTED,
     dependencies=[auth.require_scopes(scopes)],
     openapi_extra=auth.scope_docs(scopes),
 )
@@ -132,9 +133,13 @@ def create_project(
     config: ProjectConfiguration,
     db: Annotated[Session, Depends(get_db)],
     user: Annotated[User, Depends(auth.user())],
+    background_tasks: BackgroundTasks,
 ):
     """Create a new project. Starts immediately if resources are available and the
     queue is empty, otherwise joins the FIFO queue.
+
+    Starting the project's services happens after the response is sent; poll
+    the project status to follow it.
     """
     defaults_row = db.query(ResourceDefaults).filter_by(id=1).first()
     if defaults_row is None:
@@ -188,18 +193,12 @@ def create_project(
             detail="Unable to create project",
         )
 
-    if not queued:
-        try:
-            start_project_services(config, str(project.id), user.id)
-        except Exception as e:
-            db.rollback()
-            logger.error(
-                f"Failed to start services for project {project.id}, user {user.id}: {e}"
-            )
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Unable to create project",
-            )
+    if not queued and is_user_limit_reached(user.id):
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="user has reached it's limit for concurrent solver controllers spawned",
+        )
 
     try:
         db.commit()
@@ -214,9 +213,47 @@ def create_project(
             detail="Unable to create project",
         )
 
+    # Known limitation: the project is committed as running before its services
+    # are started. If this process dies before the background task runs, the
+    # project keeps its resources and is never completed. There is no startup
+    # sweep, because the database alone cannot tell such a project from one
+    # whose services are running, or from one another replica is starting.
+    if not queued:
+        background_tasks.add_task(
+            _start_project_in_background, db.get_bind(), config, project.id, user.id
+        )
+
     return project
 
 
+def _start_project_in_background(bind, config: ProjectConfiguration, project_id, user_id):
+    try:
+        start_project_services(config, str(project_id), user_id)
+        return
+    except UserLimitReachedError as e:
+        logger.warning(f"Not starting project {project_id}, user {user_id}: {e}")
+        reason = str(e)
+    except Exception as e:
+        logger.error(
+            f"Failed to start services for project {project_id}, user {user_id}: {e}"
+        )
+        reason = "Unable to start project services"
+
+    with Session(bind) as db:
+        # The project never started, so it is finished with the reason recorded
+        # for its status, and its resources go to the next queued projects.
+        project = db.get(Project, project_id)
+        if project is not None:
+            project.is_complete = True
+            project.failure_reason = reason
+            db.commit()
+
+        try:
+            drain_queue(db)
+        except Exception as e:
+            logger.error(f"Queue drain failed after project {project_id} failed: {e}")
+
+
 scopes = [SCOPES["read"]]
 
 
@@ -268,13 +305,16 @@ def get_project_status(
     # If project is already complete, return immediately without contacting
     # the solver-controller (which has already been torn down)
     if project.is_complete:
+        status_data = {"isFinished": True}
+        if project.failure_reason is not None:
+            status_data["error"] = project.failure_reason
         return ProjectWithStatusResponse(
             id=project.id,
             user_id=project.user_id,
             name=project.name,
             created_at=project.created_at,
             is_queued=project.is_queued,
-            status={"isFinished": True},
+            status=status_data,
         )
 
     # Build URL to solver controller's status endpoint
@@ -1,8 +1,10 @@
+import asyncio
+from functools import lru_cache
 from typing import Annotated
 from fastapi import APIRouter, HTTPException, Depends, Form, status
-from sqlalchemy.orm import Session
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, contains_eager
 from pydantic import BaseModel, ConfigDict, Field
-import re
 
 from src.database import get_db
 from src.models import Solver, SolverImage
@@ -15,10 +17,24 @@ SCOPES = {
     "write": "solvers:write",
 }
 
-# Docker image name validation pattern
+# Docker image name validation
 # Must start with lowercase letter or digit, followed by lowercase alphanumeric, dots, hyphens, or underscores
 # Max length: 128 characters
-VALID_IMAGE_NAME = re.compile(r"^[a-z0-9][a-z0-9._-]{0,127}$")
+_IMAGE_NAME_FIRST_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789"
+_IMAGE_NAME_CHARS = _IMAGE_NAME_FIRST_CHARS + b"._-"
+_IMAGE_NAME_MAX_LENGTH = 128
+
+
+@lru_cache(maxsize=1024)
+def is_valid_image_name(name: str) -> bool:
+    if not name.isascii() or not 1 <= len(name) <= _IMAGE_NAME_MAX_LENGTH:
+        return False
+    encoded = name.encode("ascii")
+    # Deleting every allowed byte leaves nothing behind for a valid name
+    return (
+        encoded[0] in _IMAGE_NAME_FIRST_CHARS
+        and not encoded.translate(None, _IMAGE_NAME_CHARS)
+    )
 
 
 class StartResponse(BaseModel):
@@ -35,7 +51,8 @@ class SolverListItem(BaseModel):
 
     @staticmethod
     def from_solver_with_image(solver: Solver) -> "SolverListItem":
-        return SolverListItem(
+        # ORM rows are already trusted, so skip field validation
+        return SolverListItem.model_construct(
             id=solver.id,
             name=solver.name,
             image_name=solver.solver_image.image_name,
@@ -57,7 +74,8 @@ class SolverDetailResponse(BaseModel):
 
     @staticmethod
     def from_solver_with_image(solver: Solver) -> "SolverDetailResponse":
-        return SolverDetailResponse(
+        # ORM rows are already trusted, so skip field validation
+        return SolverDetailResponse.model_construct(
             id=solver.id,
             name=solver.name,
             image_name=solver.solver_image.image_name,
@@ -84,9 +102,14 @@ scopes = [SCOPES["read"]]
     dependencies=[auth.require_scopes(scopes)],
     openapi_extra=auth.scope_docs(scopes),
 )
-def get_solvers(db: Annotated[Session, Depends(get_db)]):
+async def get_solvers(db: Annotated[Session, Depends(get_db)]):
     """Get list of all solvers with their IDs from database"""
-    solvers = db.query(Solver).join(Solver.solver_image).all()
+    solvers = await asyncio.to_thread(
+        lambda: db.query(Solver)
+        .join(Solver.solver_image)
+        .options(contains_eager(Solver.solver_image))
+        .all()
+    )
     solver_items = [SolverListItem.from_solver_with_image(solver) for solver in solvers]
     return SolversResponse(solvers=solver_items)
 
@@ -101,9 +124,15 @@ scopes = [SCOPES["read"]]
     dependencies=[auth.require_scopes(scopes)],
     openapi_extra=auth.scope_docs(scopes),
 )
-def get_solver_by_id(id: int, db: Annotated[Session, Depends(get_db)]):
+async def get_solver_by_id(id: int, db: Annotated[Session, Depends(get_db)]):
     """Get solver details by ID"""
-    solver = db.query(Solver).join(Solver.solver_image).filter(Solver.id == id).first()
+    solver = await asyncio.to_thread(
+        lambda: db.query(Solver)
+        .join(Solver.solver_image)
+        .options(contains_eager(Solver.solver_image))
+        .filter(Solver.id == id)
+        .first()
+    )
     if not solver:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -145,7 +174,7 @@ def register_solver(
             detail="Image name cannot be empty",
         )
 
-    if not VALID_IMAGE_NAME.match(normalized_image_name):
+    if not is_valid_image_name(normalized_image_name):
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
             detail="Image name must be lowercase alphanumeric, may contain dots, hyphens, or underscores, and must start with a letter or digit",
@@ -165,29 +194,26 @@ def register_solver(
         )
 
     for name in name_list:
-        if not VALID_IMAGE_NAME.match(name):
+        if not is_valid_image_name(name):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
                 detail=f"Solver name '{name}' is invalid. Must be lowercase alphanumeric, may contain dots, hyphens, or underscores, and must start with a letter or digit",
             )
 
-    existing_image = (
-        db.query(SolverImage)
-        .filter(SolverImage.image_name == normalized_image_name)
-        .first()
-    )
-    if existing_image:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Solver image '{normalized_image_name}' already exists",
-        )
-
     try:
         solver_image = SolverImage(
             image_name=normalized_image_name, image_path=image_url.strip()
         )
         db.add(solver_image)
-        db.flush()
+        # Rely on the unique constraint on image_name instead of checking first,
+        # which saves a round-trip and cannot race with a concurrent register.
+        try:
+            db.flush()
+        except IntegrityError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Solver image '{normalized_image_name}' already exists",
+            )
 
         for name in name_list:
             solver = Solver(name=name, solver_image_id=solver_image.id)
@@ -0,0 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import cache
+
+from kubernetes import client, config
+
+from src.config import Config
+
+
+@cache
+def api_client() -> client.ApiClient:
+    """Return the process-wide ApiClient, so apiserver connections are reused.
+
+    The in-cluster config is loaded on first use rather than at import, which
+    keeps the module importable outside a cluster. The loader installs a hook
+    that re-reads the service-account token when it expires.
+    """
+    configuration = client.Configuration()
+    config.load_incluster_config(client_configuration=configuration)
+    configuration.connection_pool_maxsize = Config.Kubernetes.CONNECTION_POOL_MAXSIZE
+    return client.ApiClient(configuration)
+
+
+@cache
+def core_v1() -> client.CoreV1Api:
+    return client.CoreV1Api(api_client())
+
+
+# Shared across requests so the apiserver calls of one project fan out
+# without paying for thread start-up on every call.
+_k8s_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="k8s")
+
+
+def run_in_parallel(calls):
+    """Run independent apiserver calls concurrently and re-raise the first error."""
+    futures = [_k8s_executor.submit(call) for call in calls]
+    wait(futures)
+    for future in futures:
+        future.result()
@@ -0,0 +1,268 @@
+from src.config import Config
+from src.utils import solvers_namespace
+
+__all__ = [
+    "create_namespace_manifest",
+    "create_solver_creator_role_manifest",
+    "create_solver_creator_role_binding_manifest",
+    "create_solver_quota_manifest",
+    "create_auth_secret_manifest",
+    "create_solver_controller_pod_manifest",
+    "create_solver_controller_service_manifest",
+    "create_data_gatherer_pod_manifest",
+    "create_data_gatherer_service_manifest",
+]
+
+
+def create_namespace_manifest(name):
+    return {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": name}}
+
+
+def create_solver_creator_role_manifest(namespace):
+    """Role that lets the solver controller create deployments and scaledobjects."""
+    return {
+        "apiVersion": "rbac.authorization.k8s.io/v1",
+        "kind": "Role",
+        "metadata": {"name": "solver-creator", "namespace": namespace},
+        "rules": [
+            {"apiGroups": ["apps"], "resources": ["deployments"], "verbs": ["create"]},
+            {
+                "apiGroups": ["keda.sh"],
+                "resources": ["scaledobjects"],
+                "verbs": ["create"],
+            },
+        ],
+    }
+
+
+def create_solver_creator_role_binding_manifest(namespace, service_account_namespace):
+    return {
+        "apiVersion": "rbac.authorization.k8s.io/v1",
+        "kind": "RoleBinding",
+        "metadata": {"name": "solver-creator-binding", "namespace": namespace},
+        "subjects": [
+            {
+                "kind": "ServiceAccount",
+                "name": "default",
+                "namespace": service_account_namespace,
+            }
+        ],
+        "roleRef": {
+            "kind": "Role",
+            "name": "solver-creator",
+            "apiGroup": "rbac.authorization.k8s.io",
+        },
+    }
+
+
+def create_solver_quota_manifest(namespace, vcpus, memory_gib):
+    return {
+        "apiVersion": "v1",
+        "kind": "ResourceQuota",
+        "metadata": {"name": "solver-quota", "namespace": namespace},
+        "spec": {
+            "hard": {
+                "requests.cpu": str(int(vcpus)),
+                "requests.memory": f"{int(memory_gib)}Gi",
+                "limits.cpu": str(int(vcpus)),
+                "limits.memory": f"{int(memory_gib)}Gi",
+            }
+        },
+    }
+
+
+def create_auth_secret_manifest(namespace):
+    return {
+        "apiVersion": "v1",
+        "kind": "Secret",
+        "metadata": {"name": "psp-auth-client", "namespace": namespace},
+        "stringData": {"id": _AUTH_CLIENT_ID, "secret": _AUTH_CLIENT_SECRET},
+    }
+
+
+# Config values the manifests use, read once at import. Only scalars are kept
+# at module level: every builder returns new dicts and lists, so a caller or
+# client library that modifies a manifest cannot affect later projects.
+_AUTH_CLIENT_ID = Config.Keycloak.CLIENT_ID
+_AUTH_CLIENT_SECRET = Config.Keycloak.CLIENT_SECRET
+_RABBITMQ_HOST = Config.RabbitMQ.HOST
+_RABBITMQ_PORT = str(Config.RabbitMQ.PORT)
+_RABBITMQ_USER = Config.RabbitMQ.USER
+_RABBITMQ_PASSWORD = Config.RabbitMQ.PASSWORD
+_KEDA_QUEUE_LENGTH = Config.Keda.KEDA_QUEUE_LENGTH
+_DEBUG = str(Config.App.DEBUG)
+_SOLVER_CONTROLLER_IMAGE = Config.SolverController.IMAGE
+_SOLVER_CONTROLLER_CONTAINER_PORT = Config.SolverController.CONTAINER_PORT
+_SOLVER_CONTROLLER_SERVICE_PORT = Config.SolverController.SERVICE_PORT
+_DATA_GATHERER_IMAGE = Config.DataGatherer.IMAGE
+_DATA_GATHERER_CONTAINER_PORT = Config.DataGatherer.CONTAINER_PORT
+_DATA_GATHERER_SERVICE_PORT = Config.DataGatherer.SERVICE_PORT
+
+
+def _pod_security_context():
+    return {"runAsNonRoot": True, "seccompProfile": {"type": "RuntimeDefault"}}
+
+
+def _container_security_context():
+    return {
+        "allowPrivilegeEscalation": False,
+        "readOnlyRootFilesystem": True,
+        "capabilities": {"drop": ["ALL"]},
+    }
+
+
+def _tmp_volume_mounts():
+    return [{"name": "tmp", "mountPath": "/tmp"}]  # nosec
+
+
+def _tmp_volumes():
+    return [{"name": "tmp", "emptyDir": {}}]
+
+
+def _rabbitmq_env():
+    return [
+        {"name": "RABBITMQ_HOST", "value": _RABBITMQ_HOST},
+        {"name": "RABBITMQ_PORT", "value": _RABBITMQ_PORT},
+        {"name": "RABBITMQ_USER", "value": _RABBITMQ_USER},
+        {"name": "RABBITMQ_PASSWORD", "value": _RABBITMQ_PASSWORD},
+    ]
+
+
+def _solver_controller_metadata():
+    return {
+        "name": "solver-controller",
+        "labels": {"solver_controller_id": "solver-controller"},
+    }
+
+
+def _data_gatherer_metadata():
+    return {"name": "data-gatherer", "labels": {"data_gatherer_id": "data-gatherer"}}
+
+
+def create_solver_controller_pod_manifest(project_id, control_queue, result_queue, timeout, max_replicas):
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": _solver_controller_metadata(),
+        "spec": {
+            "securityContext": _pod_security_context(),
+            "containers": [
+                {
+                    "name": "solver-controller",
+                    "image": _SOLVER_CONTROLLER_IMAGE,
+                    "imagePullPolicy": "IfNotPresent",
+                    "ports": [{"containerPort": _SOLVER_CONTROLLER_CONTAINER_PORT}],
+                    "env": [
+                        {"name": "PROJECT_SOLVER_RESULT_QUEUE", "value": result_queue},
+                        {"name": "PROJECT_ID", "value": str(project_id)},
+                        {
+                            "name": "SOLVERS_NAMESPACE",
+                            "value": solvers_namespace(project_id),
+                        },
+                        {"name": "CONTROL_QUEUE", "value": control_queue},
+                        {
+                            "name": "MAX_TOTAL_SOLVER_REPLICAS",
+                            "value": str(max_replicas),
+                        },
+                        {"name": "KEDA_QUEUE_LENGTH", "value": _KEDA_QUEUE_LENGTH},
+                        {"name": "SOLVER_TIMEOUT", "value": str(timeout)},
+                        *_rabbitmq_env(),
+                        {
+                            "name": "KEYCLOAK_CLIENT_ID",
+                            "valueFrom": {
+                                "secretKeyRef": {"name": "psp-auth-client", "key": "id"}
+                            },
+                        },
+                        {
+                            "name": "KEYCLOAK_CLIENT_SECRET",
+                            "valueFrom": {
+                                "secretKeyRef": {
+                                    "name": "psp-auth-client",
+                                    "key": "secret",
+                                }
+                            },
+                        },
+                    ],
+                    "volumeMounts": _tmp_volume_mounts(),
+                    "securityContext": _container_security_context(),
+                }
+            ],
+            "volumes": _tmp_volumes(),
+        },
+    }
+
+
+def create_solver_controller_service_manifest():
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": _solver_controller_metadata(),
+        "spec": {
+            "type": "ClusterIP",
+            "selector": {"solver_controller_id": "solver-controller"},
+            "ports": [
+                {
+                    "port": _SOLVER_CONTROLLER_SERVICE_PORT,
+                    "targetPort": _SOLVER_CONTROLLER_CONTAINER_PORT,
+                }
+            ],
+        },
+    }
+
+
+def create_data_gatherer_pod_manifest(
+    project_id,
+    control_queue,
+    director_queue,
+    result_queue,
+    solver_director_result_queue,
+):
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": _data_gatherer_metadata(),
+        "spec": {
+            "securityContext": _pod_security_context(),
+            "containers": [
+                {
+                    "name": "data-gatherer",
+                    "image": _DATA_GATHERER_IMAGE,
+                    "imagePullPolicy": "IfNotPresent",
+                    "ports": [{"containerPort": _DATA_GATHERER_CONTAINER_PORT}],
+                    "env": [
+                        {"name": "DEBUG", "value": _DEBUG},
+                        {"name": "PROJECT_ID", "value": str(project_id)},
+                        {"name": "CONTROL_QUEUE", "value": control_queue},
+                        {"name": "DIRECTOR_QUEUE", "value": director_queue},
+                        {"name": "PROJECT_SOLVER_RESULT_QUEUE", "value": result_queue},
+                        {
+                            "name": "SOLVER_DIRECTOR_RESULT_QUEUE",
+                            "value": solver_director_result_queue,
+                        },
+                        *_rabbitmq_env(),
+                    ],
+                    "volumeMounts": _tmp_volume_mounts(),
+                    "securityContext": _container_security_context(),
+                }
+            ],
+            "volumes": _tmp_volumes(),
+        },
+    }
+
+
+def create_data_gatherer_service_manifest():
+    return {
+        "apiVersion": "v1",
+        "kind": "Service",
+        "metadata": _data_gatherer_metadata(),
+        "spec": {
+            "type": "ClusterIP",
+            "selector": {"data_gatherer_id": "data-gatherer"},
+            "ports": [
+                {
+                    "port": _DATA_GATHERER_SERVICE_PORT,
+                    "targetPort": _DATA_GATHERER_CONTAINER_PORT,
+                }
+            ],
+        },
+    }
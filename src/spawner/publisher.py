@@ -0,0 +1,89 @@
+import logging
+import threading
+
+import pika
+from pika.exceptions import AMQPConnectionError
+
+from src.config import Config
+
+logger = logging.getLogger(__name__)
+
+# BlockingConnection is not thread-safe, and sync routes run in a threadpool,
+# so every use of the shared connection goes through this lock.
+_lock = threading.Lock()
+_connection: pika.BlockingConnection | None = None
+_channel = None
+
+
+def _connect():
+    credentials = pika.PlainCredentials(Config.RabbitMQ.USER, Config.RabbitMQ.PASSWORD)
+    parameters = pika.ConnectionParameters(
+        host=Config.RabbitMQ.HOST, port=Config.RabbitMQ.PORT, credentials=credentials
+    )
+    return pika.BlockingConnection(parameters)
+
+
+def _get_channel():
+    global _connection, _channel
+    if _connection is not None and _connection.is_open:
+        try:
+            # Service heartbeats missed while idle, which also notices a
+            # connection the broker has already dropped.
+            _connection.process_data_events(time_limit=0)
+        except AMQPConnectionError:
+            logger.info("RabbitMQ connection was lost, reconnecting")
+            _reset()
+
+    if _connection is None or _connection.is_closed:
+        _connection = _connect()
+        _channel = None
+    if _channel is None or _channel.is_closed:
+        _channel = _connection.channel()
+        # The broker acks each publish once it is stored, so a message it
+        # could not take raises here instead of being dropped silently.
+        _channel.confirm_delivery()
+    return _channel
+
+
+def _reset():
+    global _connection, _channel
+    if _connection is not None and _connection.is_open:
+        try:
+            _connection.close()
+        except Exception as e:
+            # The connection is usually broken already, closing is best effort
+            logger.debug(f"Closing RabbitMQ connection failed: {e}")
+    _connection = None
+    _channel = None
+
+
+def publish(queue: str, body: bytes):
+    """Publish a persistent message to a quorum queue over a shared connection.
+
+    The connection is opened on first use and kept for later publishes. If it
+    fails mid-publish it is reopened and the publish is tried once more.
+    Publisher confirms are enabled, so this returns once the broker has
+    stored the message.
+    """
+    with _lock:
+        for attempt in range(2):
+            try:
+                channel = _get_channel()
+                channel.queue_declare(
+                    queue=queue, durable=True, arguments={"x-queue-type": "quorum"}
+                )
+                channel.basic_publish(
+                    exchange="",  # Default exchange
+                    routing_key=queue,
+                    body=body,
+                    properties=pika.BasicProperties(
+                        delivery_mode=pika.DeliveryMode.Persistent
+                    ),
+                    mandatory=False,
+                )
+                return
+            except AMQPConnectionError:
+                _reset()
+                if attempt:
+                    raise
+                logger.warning("RabbitMQ connection failed while publishing, retrying")
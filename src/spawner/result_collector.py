@@ -1,6 +1,8 @@
+import asyncio
 import json
 import logging
 import aio_pika
+from sqlalchemy.orm import Session
 from src.spawner.stop_service import stop_solver_controller
 from src.spawner.queue_drain import drain_queue
 from src.spawner.queues import declare_quorum_queue, retry_or_dlq
@@ -29,48 +31,149 @@ async def result_collector():
 
     async with connection:
         channel = await connection.channel()
+        await channel.set_qos(prefetch_count=Config.ResultCollector.PREFETCH_COUNT)
         queue = await declare_quorum_queue(channel, solver_director_result_queue)
-        async with queue.iterator() as queue_iter:
-            async for message in queue_iter:
-                db = SessionLocal()
+
+        batch: list[tuple[aio_pika.abc.AbstractIncomingMessage, dict]] = []
+        flush_requested = asyncio.Event()
+
+        async def on_message(message: aio_pika.abc.AbstractIncomingMessage):
+            logger.info("Received result message")
+            try:
+                result_json = json.loads(message.body)
+            except ValueError as e:
+                logger.error(f"Failed to parse result: {e}")
+                await retry_or_dlq(channel, solver_director_result_queue, message, e)
+                return
+
+            batch.append((message, result_json))
+            # A final message triggers cleanup and queue draining, so don't let
+            # it wait for the batch to fill up.
+            if (
+                len(batch) >= Config.ResultCollector.BATCH_SIZE
+                or result_json.get("final_message", False)
+            ):
+                flush_requested.set()
+
+        await queue.consume(on_message)
+
+        while True:
+            try:
+                await asyncio.wait_for(
+                    flush_requested.wait(),
+                    timeout=Config.ResultCollector.FLUSH_INTERVAL_SECONDS,
+                )
+            except TimeoutError:
+                pass
+            flush_requested.clear()
+
+            if batch:
+                pending = batch.copy()
+                batch.clear()
                 try:
-                    logger.info("Received result message")
-                    result_data = message.body.decode()
-                    result_json = json.loads(result_data)
-                    is_final = result_json.get("final_message", False)
-                    if is_final:
-                        try:
-                            stop_solver_controller(result_json["project_id"])
-                        except Exception as cleanup_error:
-                            logger.warning(
-                                f"Failed to cleanup project {result_json.get('project_id')}: {cleanup_error}"
-                            )
-                        project = db.query(Project).filter(
-                            Project.id == result_json["project_id"]
-                        ).first()
-                        if project:
-                            project.is_complete = True
-                        result_json.pop("final_message", None)
-                        result_json.pop("total_messages", None)
-
-                    result = ProjectResult.from_json(result_json)
-                    db.add(result)
-                    db.commit()
-
-                    if is_final:
-                        try:
-                            drain_queue(db)
-                        except Exception as e:
-                            logger.error(f"Queue drain failed after project completion: {e}")
-
-                    await message.ack()
-                except Exception as e:
-                    db.rollback()
-                    if "project_results_project_id_fkey" in str(e):
-                        logger.warning(f"Ignoring result for deleted project {result_json.get('project_id')}")
-                        await message.ack()
-                    else:
-                        logger.error(f"Failed to save result: {e}", exc_info=True)
-                        await retry_or_dlq(channel, solver_director_result_queue, message, e)
-                finally:
-                    db.close()
+                    await flush_results(channel, solver_director_result_queue, pending)
+                except Exception:
+                    logger.exception("Failed to flush result batch")
+                    await _requeue_unprocessed(pending)
+
+
+async def flush_results(
+    channel,
+    queue_name: str,
+    pending: list[tuple[aio_pika.abc.AbstractIncomingMessage, dict]],
+):
+    """Save a batch of results in one transaction, then ack each message.
+
+    If the batch fails to commit, fall back to saving the messages one by one
+    so a single bad result (e.g. for a deleted project) only affects itself.
+
+    Saving is blocking (database commits, and Kubernetes calls when a project
+    completes), so it runs in a worker thread to keep message delivery and
+    heartbeats on the event loop going.
+    """
+    try:
+        await asyncio.to_thread(
+            _save_in_new_session, [result_json for _, result_json in pending]
+        )
+    except Exception as e:
+        logger.warning(
+            f"Failed to save batch of {len(pending)} results, retrying one by one: {e}"
+        )
+        for message, result_json in pending:
+            await _save_single_result(channel, queue_name, message, result_json)
+        return
+
+    # Each message is acked on its own rather than with multiple=True: a
+    # message that failed to parse sits between the batch's delivery tags and
+    # is acked separately by retry_or_dlq, and a second ack of a tag already
+    # covered by a multiple ack makes the broker close the channel.
+    for message, _ in pending:
+        await message.ack()
+
+
+async def _requeue_unprocessed(
+    pending: list[tuple[aio_pika.abc.AbstractIncomingMessage, dict]],
+):
+    # Unsettled messages count against the prefetch window, so hand them back
+    # to the broker instead of letting them stall the consumer.
+    for message, _ in pending:
+        if message.processed:
+            continue
+        try:
+            await message.nack(requeue=True)
+        except Exception:
+            logger.exception("Failed to requeue result message")
+
+
+async def _save_single_result(
+    channel,
+    queue_name: str,
+    message: aio_pika.abc.AbstractIncomingMessage,
+    result_json: dict,
+):
+    try:
+        await asyncio.to_thread(_save_in_new_session, [result_json])
+        await message.ack()
+    except Exception as e:
+        if "project_results_project_id_fkey" in str(e):
+            logger.warning(f"Ignoring result for deleted project {result_json.get('project_id')}")
+            await message.ack()
+        else:
+            logger.error(f"Failed to save result: {e}", exc_info=True)
+            await retry_or_dlq(channel, queue_name, message, e)
+
+
+def _save_in_new_session(results: list[dict]) -> None:
+    # Sessions are not thread-safe, so each save in a worker thread gets its own
+    db = SessionLocal()
+    try:
+        save_results(db, results)
+    finally:
+        db.close()
+
+
+def save_results(db: Session, results: list[dict]) -> None:
+    """Insert results with a single commit, completing any finished projects."""
+    has_final = False
+    for result_json in results:
+        if result_json.get("final_message", False):
+            has_final = True
+            _complete_project(db, result_json["project_id"])
+        db.add(ProjectResult.from_json(result_json))
+    db.commit()
+
+    if has_final:
+        try:
+            drain_queue(db)
+        except Exception as e:
+            logger.error(f"Queue drain failed after project completion: {e}")
+
+
+def _complete_project(db: Session, project_id):
+    try:
+        stop_solver_controller(project_id)
+    except Exception as cleanup_error:
+        logger.warning(f"Failed to cleanup project {project_id}: {cleanup_error}")
+    project = db.query(Project).filter(Project.id == project_id).first()
+    if project:
+        project.is_complete = True
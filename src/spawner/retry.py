@@ -0,0 +1,53 @@
+import functools
+import logging
+import random
+import time
+
+from kubernetes.client.rest import ApiException
+from pika.exceptions import AMQPConnectionError
+from urllib3.exceptions import HTTPError
+
+logger = logging.getLogger(__name__)
+
+# Throttling and server-side failures that are worth another try. A 409 or
+# other client error will fail the same way again, so it is raised at once.
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_transient(error: Exception) -> bool:
+    if isinstance(error, ApiException):
+        # Pods are rejected with 403 until the controller manager has created
+        # the default ServiceAccount of a brand new namespace.
+        if error.status == 403 and "error looking up service account" in (
+            error.body or ""
+        ):
+            return True
+        return error.status in RETRYABLE_STATUSES
+    # Connection resets and timeouts to the apiserver or the broker
+    return isinstance(error, (HTTPError, AMQPConnectionError))
+
+
+def retry_transient(attempts: int = 3, base_delay: float = 0.5, max_delay: float = 30):
+    """Retry a call on transient errors with exponential backoff and full jitter."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for attempt in range(attempts):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    if attempt == attempts - 1 or not is_transient(e):
+                        raise
+                    # Jitter only spreads retries out, it is not security-sensitive
+                    delay = random.uniform(  # nosec B311
+                        0, min(max_delay, base_delay * 2**attempt)
+                    )
+                    logger.warning(
+                        f"{func.__name__} failed ({e!r}), retrying in {delay:.2f}s"
+                    )
+                    time.sleep(delay)
+
+        return wrapper
+
+    return decorator
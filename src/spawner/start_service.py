@@ -1,384 +1,157 @@
-import json
-from fastapi import HTTPException
-
-from kubernetes import client, config
-from kubernetes.client.rest import ApiException
-from src.spawner.stop_service import stop_solver_controller
-from src.utils import (
-    solvers_namespace,
-    control_queue_name,
-    solver_director_result_queue_name,
-    result_queue_name,
-    project_director_queue_name,
+import logging
+from functools import partial
+
+from kubernetes import client
+from src.spawner.k8s_clients import api_client, run_in_parallel
+from src.spawner.manifests import (
+    create_auth_secret_manifest,
+    create_data_gatherer_pod_manifest,
+    create_data_gatherer_service_manifest,
+    create_namespace_manifest,
+    create_solver_controller_pod_manifest,
+    create_solver_controller_service_manifest,
+    create_solver_creator_role_binding_manifest,
+    create_solver_creator_role_manifest,
+    create_solver_quota_manifest,
 )
-from src.spawner.status_service import is_user_limit_reached
-
-from src.config import Config
-import pika
-
-
-def _create_auth_secret(kube_client: client.CoreV1Api, namespace: str):
-    secret = client.V1Secret(
-        metadata=client.V1ObjectMeta(name="psp-auth-client", namespace=namespace),
-        string_data={
-            "id": Config.Keycloak.CLIENT_ID,
-            "secret": Config.Keycloak.CLIENT_SECRET,
+from src.spawner.publisher import publish
+from src.spawner.retry import retry_transient
+from src.spawner.stop_service import stop_solver_controller
+from src.utils import project_names, solver_director_result_queue_name
+from src.spawner.status_service import UserLimitReachedError, is_user_limit_reached
+
+__all__ = ["start_project_services"]
+
+logger = logging.getLogger(__name__)
+
+
+FIELD_MANAGER = "solver-director"
+
+def _plural(kind: str) -> str:
+    # The REST path name of a kind. Every kind a project is made of (Namespace,
+    # Role, RoleBinding, ResourceQuota, Secret, Pod, Service) pluralizes
+    # regularly; irregular ones like NetworkPolicy would need a special case.
+    return f"{kind.lower()}s"
+
+
+# Five attempts leave a few seconds for a new namespace's default
+# ServiceAccount to appear before a pod apply gives up.
+@retry_transient(attempts=5)
+def _apply(api_client: client.ApiClient, manifest: dict, namespace=None):
+    """Create or update a resource with Server-Side Apply.
+
+    Applying is idempotent, so re-running for a project that was partially
+    spawned updates what exists instead of failing on it. The typed API
+    classes cannot send an apply patch, so the request is made directly.
+    """
+    api_version = manifest["apiVersion"]
+    prefix = "/api/v1" if api_version == "v1" else f"/apis/{api_version}"
+    namespace = namespace or manifest["metadata"].get("namespace")
+    if namespace is not None:
+        prefix = f"{prefix}/namespaces/{namespace}"
+    path = f"{prefix}/{_plural(manifest['kind'])}/{manifest['metadata']['name']}"
+
+    api_client.call_api(
+        path,
+        "PATCH",
+        # force takes ownership of fields another manager set, e.g. on a re-run
+        query_params=[("fieldManager", FIELD_MANAGER), ("force", "true")],
+        header_params={
+            "Accept": "application/json",
+            "Content-Type": "application/apply-patch+yaml",
         },
+        body=manifest,
+        auth_settings=["BearerToken"],
+        response_type="object",
+        _return_http_data_only=True,
     )
-    try:
-        kube_client.create_namespaced_secret(namespace=namespace, body=secret)
-    except ApiException as e:
-        if e.status == 409:
-            pass
-        else:
-            raise
 
 
-def start_project_services(project_config, id, user_id):
-    users_solver_controller_limit_reached = is_user_limit_reached(user_id)
-    if users_solver_controller_limit_reached:
-        raise HTTPException(
-            status_code=429,
-            detail="user has reached it's limit for concurrent solver controllers spawned",
-        )
-    config.load_incluster_config()
-    kube_client = client.CoreV1Api()
-
-    namespace_manifest = {
-        "apiVersion": "v1",
-        "kind": "Namespace",
-        "metadata": {"name": id},
-    }
-    try:
-        kube_client.create_namespace(body=namespace_manifest)
-    except ApiException as e:
-        if e.status == 409:
-            pass  # already exists
-        else:
-            raise
+# Not wrapped in retry_transient: publish already reconnects and retries once
+# when the broker connection fails.
+def _publish_problem_groups(queue, project_config):
+    # Serialized by pydantic-core straight from the model, without building an
+    # intermediate dict for the stdlib encoder
+    body = project_config.model_dump_json(include={"problem_groups"}).encode()
+    publish(queue, body)
 
-    _solvers_namespace = solvers_namespace(id)
-    solvers_namespace_manifest = {
-        "apiVersion": "v1",
-        "kind": "Namespace",
-        "metadata": {"name": _solvers_namespace},
-    }
-    try:
-        kube_client.create_namespace(body=solvers_namespace_manifest)
-    except ApiException as e:
-        if e.status == 409:
-            pass  # already exists
-        else:
-            raise
 
-    # Create Role in solvers namespace to allow creating deployments and scaledobjects
-    role = client.V1Role(
-        metadata=client.V1ObjectMeta(
-            name="solver-creator", namespace=_solvers_namespace
-        ),
-        rules=[
-            client.V1PolicyRule(
-                api_groups=["apps"],
-                resources=["deployments"],
-                verbs=["create"],
-            ),
-            client.V1PolicyRule(
-                api_groups=["keda.sh"],
-                resources=["scaledobjects"],
-                verbs=["create"],
-            ),
-        ],
-    )
-    rbac_client = client.RbacAuthorizationV1Api()
-    try:
-        rbac_client.create_namespaced_role(namespace=_solvers_namespace, body=role)
-    except ApiException as e:
-        if e.status == 409:
-            pass
-        else:
-            raise
-
-    # Create RoleBinding in solvers namespace
-    role_binding = client.V1RoleBinding(
-        metadata=client.V1ObjectMeta(
-            name="solver-creator-binding", namespace=_solvers_namespace
-        ),
-        subjects=[
-            {
-                "kind": "ServiceAccount",
-                "name": "default",
-                "namespace": id,
-            }
-        ],
-        role_ref=client.V1RoleRef(
-            kind="Role",
-            name="solver-creator",
-            api_group="rbac.authorization.k8s.io",
-        ),
-    )
-    try:
-        rbac_client.create_namespaced_role_binding(
-            namespace=_solvers_namespace, body=role_binding
-        )
-    except ApiException as e:
-        if e.status == 409:
-            pass
-        else:
-            raise
-
-    resource_quota = {
-        "apiVersion": "v1",
-        "kind": "ResourceQuota",
-        "metadata": {"name": "solver-quota", "namespace": _solvers_namespace},
-        "spec": {
-            "hard": {
-                "requests.cpu": str(int(project_config.vcpus)),
-                "requests.memory": f"{int(project_config.memory_gib)}Gi",
-                "limits.cpu": str(int(project_config.vcpus)),
-                "limits.memory": f"{int(project_config.memory_gib)}Gi",
-            }
-        },
-    }
-    try:
-        kube_client.create_namespaced_resource_quota(
-            namespace=_solvers_namespace, body=resource_quota
+def start_project_services(project_config, id, user_id):
+    if is_user_limit_reached(user_id):
+        raise UserLimitReachedError(
+            "User has reached the limit for concurrent solver controllers spawned"
         )
-    except ApiException as e:
-        if e.status == 409:
-            pass
-        else:
-            raise
+    apply = partial(_apply, api_client())
 
-    _create_auth_secret(kube_client, id)
-    _create_auth_secret(kube_client, _solvers_namespace)
+    names = project_names(id)
+    namespace_manifests = [
+        create_namespace_manifest(id),
+        create_namespace_manifest(names.solvers_namespace),
+    ]
 
-    control_queue = control_queue_name(id)
     solver_director_result_queue = solver_director_result_queue_name()
-    result_queue = result_queue_name(id)
-    director_queue = project_director_queue_name(id)
 
-    _ = kube_client.create_namespaced_pod(
-        namespace=id,
-        body=create_solver_controller_pod_manifest(id, control_queue, result_queue, project_config.timeout, int(project_config.vcpus)),
-    )
-    _ = kube_client.create_namespaced_service(
-        namespace=id,
-        body=create_solver_controller_service_manifest(),
-    )
-
-    _ = kube_client.create_namespaced_pod(
-        namespace=id,
-        body=create_data_gatherer_pod_manifest(
+    # Everything else lives in the namespaces, so they are the first barrier.
+    # A RoleBinding may reference a Role that does not exist yet, so the
+    # namespaced resources are created together. The pods come last: their
+    # admission needs the quota, the secrets and the namespace's default
+    # ServiceAccount to be in place.
+    solvers_namespace_manifests = [
+        create_solver_creator_role_manifest(names.solvers_namespace),
+        create_solver_creator_role_binding_manifest(names.solvers_namespace, id),
+        create_solver_quota_manifest(
+            names.solvers_namespace, project_config.vcpus, project_config.memory_gib
+        ),
+        create_auth_secret_manifest(names.solvers_namespace),
+    ]
+    project_namespace_manifests = [
+        create_auth_secret_manifest(id),
+        create_solver_controller_service_manifest(),
+        create_data_gatherer_service_manifest(),
+    ]
+    pod_manifests = [
+        create_solver_controller_pod_manifest(
             id,
-            control_queue,
-            director_queue,
-            result_queue,
+            names.control_queue,
+            names.result_queue,
+            project_config.timeout,
+            int(project_config.vcpus),
+        ),
+        create_data_gatherer_pod_manifest(
+            id,
+            names.control_queue,
+            names.director_queue,
+            names.result_queue,
             solver_director_result_queue,
         ),
-    )
-    _ = kube_client.create_namespaced_service(
-        namespace=id,
-        body=create_data_gatherer_service_manifest(),
-    )
-
-    credentials = pika.PlainCredentials(Config.RabbitMQ.USER, Config.RabbitMQ.PASSWORD)
-    parameters = pika.ConnectionParameters(
-        host=Config.RabbitMQ.HOST, port=Config.RabbitMQ.PORT, credentials=credentials
-    )
-
-    connection = pika.BlockingConnection(parameters)
+    ]
+    step = "namespaces"
     try:
-        channel = connection.channel()
-        channel.queue_declare(queue=director_queue, durable=True, arguments={"x-queue-type": "quorum"})
-        body = json.dumps(
-            {"problem_groups": project_config.model_dump()["problem_groups"]}
-        ).encode()
-
-        channel.basic_publish(
-            exchange="",  # Default exchange
-            routing_key=director_queue,
-            body=body,
-            properties=pika.BasicProperties(delivery_mode=pika.DeliveryMode.Persistent),
+        run_in_parallel(
+            [partial(apply, manifest) for manifest in namespace_manifests]
+        )
+        step = "resources"
+        run_in_parallel(
+            [partial(apply, manifest) for manifest in solvers_namespace_manifests]
+            + [
+                partial(apply, manifest, namespace=id)
+                for manifest in project_namespace_manifests
+            ]
         )
+        step = "pods"
+        run_in_parallel(
+            [partial(apply, manifest, namespace=id) for manifest in pod_manifests]
+        )
+        step = "publish"
+        _publish_problem_groups(names.director_queue, project_config)
     except Exception as e:
-        stop_solver_controller(id)
-        raise e
-    finally:
-        connection.close()
-
-
-def create_solver_controller_pod_manifest(project_id, control_queue, result_queue, timeout, max_replicas):
-    _solvers_namespace = solvers_namespace(project_id)
-
-    return {
-        "apiVersion": "v1",
-        "kind": "Pod",
-        "metadata": {
-            "name": "solver-controller",
-            "labels": {"solver_controller_id": "solver-controller"},
-        },
-        "spec": {
-            "securityContext": {
-                "runAsNonRoot": True,
-                "seccompProfile": {"type": "RuntimeDefault"},
-            },
-            "containers": [
-                {
-                    "name": "solver-controller",
-                    "image": Config.SolverController.IMAGE,
-                    "imagePullPolicy": "IfNotPresent",
-                    "ports": [
-                        {"containerPort": Config.SolverController.CONTAINER_PORT}
-                    ],
-                    "env": [
-                        {"name": "PROJECT_SOLVER_RESULT_QUEUE", "value": result_queue},
-                        {"name": "PROJECT_ID", "value": str(project_id)},
-                        {"name": "SOLVERS_NAMESPACE", "value": _solvers_namespace},
-                        # {"name": "SOLVER_TYPES", "value": "chuffed"},
-                        {"name": "CONTROL_QUEUE", "value": control_queue},
-                        {
-                            "name": "MAX_TOTAL_SOLVER_REPLICAS",
-                            "value": str(max_replicas),
-                        },
-                        # {"name": "SOLVER_DIRECTOR_URL", "value": solver_director_url},
-                        {
-                            "name": "KEDA_QUEUE_LENGTH",
-                            "value": Config.Keda.KEDA_QUEUE_LENGTH,
-                        },
-                        {
-                            "name": "SOLVER_TIMEOUT",
-                            "value": str(timeout),
-                        },
-                        {"name": "RABBITMQ_HOST", "value": Config.RabbitMQ.HOST},
-                        {"name": "RABBITMQ_PORT", "value": str(Config.RabbitMQ.PORT)},
-                        {"name": "RABBITMQ_USER", "value": Config.RabbitMQ.USER},
-                        {
-                            "name": "RABBITMQ_PASSWORD",
-                            "value": Config.RabbitMQ.PASSWORD,
-                        },
-                        {
-                            "name": "KEYCLOAK_CLIENT_ID",
-                            "valueFrom": {"secretKeyRef": {"name": "psp-auth-client", "key": "id"}},
-                        },
-                        {
-                            "name": "KEYCLOAK_CLIENT_SECRET",
-                            "valueFrom": {"secretKeyRef": {"name": "psp-auth-client", "key": "secret"}},
-                        },
-                    ],
-                    "volumeMounts": [
-                        {"name": "tmp", "mountPath": "/tmp"},  # nosec
-                    ],
-                    "securityContext": {
-                        "allowPrivilegeEscalation": False,
-                        "readOnlyRootFilesystem": True,
-                        "capabilities": {"drop": ["ALL"]},
-                    },
-                }
-            ],
-            "volumes": [
-                {"name": "tmp", "emptyDir": {}},
-            ],
-        },
-    }
-
-
-def create_solver_controller_service_manifest():
-    return {
-        "apiVersion": "v1",
-        "kind": "Service",
-        "metadata": {
-            "name": "solver-controller",
-            "labels": {"solver_controller_id": "solver-controller"},
-        },
-        "spec": {
-            "type": "ClusterIP",
-            "selector": {"solver_controller_id": "solver-controller"},
-            "ports": [
-                {
-                    "port": Config.SolverController.SERVICE_PORT,
-                    "targetPort": Config.SolverController.CONTAINER_PORT,
-                }
-            ],
-        },
-    }
-
-
-def create_data_gatherer_pod_manifest(
-    project_id,
-    control_queue,
-    director_queue,
-    result_queue,
-    solver_director_result_queue,
-):
-    return {
-        "apiVersion": "v1",
-        "kind": "Pod",
-        "metadata": {
-            "name": "data-gatherer",
-            "labels": {"data_gatherer_id": "data-gatherer"},
-        },
-        "spec": {
-            "securityContext": {
-                "runAsNonRoot": True,
-                "seccompProfile": {"type": "RuntimeDefault"},
-            },
-            "containers": [
-                {
-                    "name": "data-gatherer",
-                    "image": Config.DataGatherer.IMAGE,
-                    "imagePullPolicy": "IfNotPresent",
-                    "ports": [{"containerPort": Config.DataGatherer.CONTAINER_PORT}],
-                    "env": [
-                        {"name": "DEBUG", "value": str(Config.App.DEBUG)},
-                        {"name": "PROJECT_ID", "value": str(project_id)},
-                        {"name": "CONTROL_QUEUE", "value": control_queue},
-                        {"name": "DIRECTOR_QUEUE", "value": director_queue},
-                        {"name": "PROJECT_SOLVER_RESULT_QUEUE", "value": result_queue},
-                        {
-                            "name": "SOLVER_DIRECTOR_RESULT_QUEUE",
-                            "value": solver_director_result_queue,
-                        },
-                        {"name": "RABBITMQ_HOST", "value": Config.RabbitMQ.HOST},
-                        {"name": "RABBITMQ_PORT", "value": str(Config.RabbitMQ.PORT)},
-                        {"name": "RABBITMQ_USER", "value": Config.RabbitMQ.USER},
-                        {
-                            "name": "RABBITMQ_PASSWORD",
-                            "value": Config.RabbitMQ.PASSWORD,
-                        },
-                    ],
-                    "volumeMounts": [
-                        {"name": "tmp", "mountPath": "/tmp"},  # nosec
-                    ],
-                    "securityContext": {
-                        "allowPrivilegeEscalation": False,
-                        "readOnlyRootFilesystem": True,
-                        "capabilities": {"drop": ["ALL"]},
-                    },
-                }
-            ],
-            "volumes": [
-                {"name": "tmp", "emptyDir": {}},
-            ],
-        },
-    }
-
-
-def create_data_gatherer_service_manifest():
-    return {
-        "apiVersion": "v1",
-        "kind": "Service",
-        "metadata": {
-            "name": "data-gatherer",
-            "labels": {"data_gatherer_id": "data-gatherer"},
-        },
-        "spec": {
-            "type": "ClusterIP",
-            "selector": {"data_gatherer_id": "data-gatherer"},
-            "ports": [
-                {
-                    "port": Config.DataGatherer.SERVICE_PORT,
-                    "targetPort": Config.DataGatherer.CONTAINER_PORT,
-                }
-            ],
-        },
-    }
+        logger.error(
+            f"Spawning project {id} failed at step {step!r}, tearing it down: {e}"
+        )
+        # Deleting the namespaces cascades to everything created inside them,
+        # so a half-spawned project does not linger in the cluster.
+        try:
+            stop_solver_controller(id)
+        except Exception as cleanup_error:
+            logger.warning(f"Failed to cleanup project {id}: {cleanup_error}")
+        raise
@@ -8,6 +8,10 @@
 #     return SolverControllerStatus(user_id, challenge_id, challenge_url, started, None)
 
 
+class UserLimitReachedError(Exception):
+    """The user already runs as many solver controllers as they are allowed"""
+
+
 def is_user_limit_reached(user_id):
     return False
     # challenge_limit = fetch_challenge_limit(user_id)
@@ -1,23 +1,39 @@
 import logging
+from functools import partial
 from urllib.parse import quote
 
 import requests
-from kubernetes import client, config
+from kubernetes.client.rest import ApiException
 
 from src.config import Config
+from src.spawner.k8s_clients import core_v1, run_in_parallel
+from src.spawner.retry import retry_transient
 from src.utils import solvers_namespace
 
 logger = logging.getLogger(__name__)
 
 
 def stop_solver_controller(namespace):
-    config.load_incluster_config()
-    kube_client = client.CoreV1Api()
-    kube_client.delete_namespace(namespace)
-    kube_client.delete_namespace(solvers_namespace(namespace))
+    run_in_parallel(
+        [
+            partial(_delete_namespace, namespace),
+            partial(_delete_namespace, solvers_namespace(namespace)),
+        ]
+    )
     delete_project_queues(namespace)
 
 
+@retry_transient()
+def _delete_namespace(name):
+    # Return as soon as the namespace is marked for deletion instead of
+    # waiting on the garbage collector
+    try:
+        core_v1().delete_namespace(name, propagation_policy="Background")
+    except ApiException as e:
+        if e.status != 404:
+            raise
+
+
 def delete_project_queues(project_id):
     management_url = f"http://{Config.RabbitMQ.HOST}:{Config.RabbitMQ.MANAGEMENT_PORT}"
     auth = (Config.RabbitMQ.USER, Config.RabbitMQ.PASSWORD)
@@ -1,3 +1,5 @@
+from typing import NamedTuple
+
 from src.config import Config
 
 
@@ -19,3 +21,20 @@ def solver_director_result_queue_name():
 
 def project_director_queue_name(namespace):
     return f"project-{namespace}-director"
+
+
+class ProjectNames(NamedTuple):
+    solvers_namespace: str
+    control_queue: str
+    result_queue: str
+    director_queue: str
+
+
+def project_names(namespace) -> ProjectNames:
+    """Compute all of a project's namespace and queue names in one call."""
+    return ProjectNames(
+        solvers_namespace(namespace),
+        control_queue_name(namespace),
+        result_queue_name(namespace),
+        project_director_queue_name(namespace),
+    )
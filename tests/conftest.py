@@ -1,6 +1,8 @@
 import os
+from contextlib import ExitStack
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 os.environ["DB_HOST"] = "localhost"
 os.environ["DB_PORT"] = "5432"
@@ -9,88 +11,402 @@ os.environ["RABBITMQ_PORT"] = "5672"
 os.environ["KEYCLOAK_CLIENT_SECRET"] = "test-secret"  # nosec B105
 
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from src.database import Base, get_db
+from src.models import Group, Instance, Problem, Solver, SolverImage, problem_groups
 from psp_auth.testing import MockAuth
 from src.auth import auth_config
 
 
-@pytest.fixture(autouse=True)
-def mock_lifespan_dependencies():
-    """Mock asyncpg pool and background tasks for all tests"""
+SEEDED_SOLVER_COUNT = 4
+SEEDED_PROBLEM_COUNT = 2
+SEEDED_GROUP_COUNT = 3
+
+# Plain fakes for the asyncpg pool used by the app lifespan. They implement
+# only what the app touches, without the call recording and signature checks
+# of AsyncMock.
+
+
+class _FakeCursor:
+    """An async iterator for cursor that yields no results"""
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        raise StopAsyncIteration
+
+
+class _FakeTxn:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+class _FakeConn:
+    def transaction(self):
+        return _FakeTxn()
+
+    def cursor(self, *args, **kwargs):
+        return _FakeCursor()
 
-    # Create an async iterator for cursor that yields no results
-    class AsyncCursorIterator:
-        def __aiter__(self):
-            return self
 
-        async def __anext__(self):
-            raise StopAsyncIteration
+class _FakePool:
+    async def close(self):
+        pass
 
-    # Create a mock transaction that supports async context manager protocol
-    mock_transaction = AsyncMock()
-    mock_transaction.__aenter__ = AsyncMock(return_value=None)
-    mock_transaction.__aexit__ = AsyncMock(return_value=None)
+    def acquire(self):
+        return self
 
-    # Create a mock connection that supports async context manager protocol
-    mock_conn = AsyncMock()
-    mock_conn.transaction = MagicMock(return_value=mock_transaction)
-    mock_conn.cursor = MagicMock(return_value=AsyncCursorIterator())
+    async def __aenter__(self):
+        return _FakeConn()
 
-    # Create a mock for acquire() that returns an async context manager
-    mock_acquire = AsyncMock()
-    mock_acquire.__aenter__ = AsyncMock(return_value=mock_conn)
-    mock_acquire.__aexit__ = AsyncMock(return_value=None)
+    async def __aexit__(self, *exc_info):
+        return None
 
-    # Create the pool mock
-    mock_pool = AsyncMock()
-    mock_pool.close = AsyncMock()
-    mock_pool.acquire = MagicMock(return_value=mock_acquire)
 
-    async def mock_create_pool(*args, **kwargs):
-        return mock_pool
+mock_pool = _FakePool()
 
-    mock_result_collector = AsyncMock()
 
-    with (
-        patch("src.main.asyncpg.create_pool", side_effect=mock_create_pool),
-        patch("src.main.result_collector", return_value=mock_result_collector),
-    ):
+async def mock_create_pool(*args, **kwargs):
+    return mock_pool
+
+
+mock_result_collector = AsyncMock()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def mock_lifespan_dependencies():
+    """Mock asyncpg pool and background tasks for the whole test session"""
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch("src.main.asyncpg.create_pool", side_effect=mock_create_pool)
+        )
+        stack.enter_context(
+            patch("src.main.result_collector", return_value=mock_result_collector)
+        )
         yield
 
 
-@pytest.fixture
+# The session the app's get_db hands out, set per test by the client
+# fixtures. A ContextVar would not work here, since TestClient runs the app in
+# its own thread.
+_current_db: Session | None = None
+
+
+def _override_get_db():
+    yield _current_db
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Simple test client for non-database tests"""
+    """Test client shared by all tests, so the app lifespan runs only once"""
     from src.main import app
 
-    with TestClient(app) as client:
-        yield client
+    # Registered once, so tests only swap the session it yields
+    app.dependency_overrides[get_db] = _override_get_db
+    try:
+        with TestClient(app) as client:
+            yield client
+    finally:
+        app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def test_db():
-    """Create an in-memory test database"""
+@pytest.fixture(scope="session")
+def engine():
+    """In-memory test database whose schema is created once per session"""
     engine = create_engine(
-        "sqlite:///:memory:",
+        "sqlite://",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
-    TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-    # Create all tables
-    Base.metadata.create_all(bind=engine)
+    # pysqlite's own transaction handling breaks SAVEPOINT, so leave it to
+    # SQLAlchemy to emit BEGIN
+    @event.listens_for(engine, "connect")
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        # Nothing needs to survive a crash, so skip syncing and keep temporary
+        # tables and indices out of files. An in-memory database already
+        # journals in memory.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def connection(engine):
+    """Connection in an outer transaction that is rolled back after the test"""
+    connection = engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
 
-    # Create a test database session
-    db = TestingSessionLocal()
+
+@pytest.fixture
+def test_db(connection):
+    """Test database session; its commits only release a SAVEPOINT"""
+    db = Session(
+        bind=connection, autoflush=False, join_transaction_mode="create_savepoint"
+    )
     try:
         yield db
     finally:
         db.close()
-        Base.metadata.drop_all(bind=engine)
+
+
+def seed_solvers(connection, count):
+    """Insert solvers and their images with one multi-row INSERT each.
+
+    Returns the solver ids in creation order.
+    """
+    solver_images = SolverImage.__table__
+    solvers = Solver.__table__
+    image_ids = connection.execute(
+        solver_images.insert().returning(
+            solver_images.c.id, sort_by_parameter_order=True
+        ),
+        [
+            {
+                "image_name": f"solver-{i}",
+                "image_path": f"ghcr.io/portfolio-solver-platform/solver-{i}:latest",
+            }
+            for i in range(count)
+        ],
+    ).scalars().all()
+    return connection.execute(
+        solvers.insert().returning(solvers.c.id, sort_by_parameter_order=True),
+        [
+            {"name": f"solver-{i}", "solver_image_id": image_id}
+            for i, image_id in enumerate(image_ids)
+        ],
+    ).scalars().all()
+
+
+@pytest.fixture(scope="module")
+def seeded_solver_ids(engine):
+    """Ids of solvers shared by the tests of a module.
+
+    They are committed outside the per-test transaction, so they survive each
+    test's rollback, and are removed again when the module finishes.
+    """
+    with engine.begin() as connection:
+        ids = seed_solvers(connection, SEEDED_SOLVER_COUNT)
+
+    yield ids
+
+    solvers = Solver.__table__
+    with engine.begin() as connection:
+        image_ids = connection.execute(
+            select(solvers.c.solver_image_id).where(solvers.c.id.in_(ids))
+        ).scalars().all()
+        connection.execute(solvers.delete().where(solvers.c.id.in_(ids)))
+        connection.execute(
+            SolverImage.__table__.delete().where(
+                SolverImage.__table__.c.id.in_(image_ids)
+            )
+        )
+
+
+def seed_groups(connection, count, prefix="seeded-group"):
+    """Insert groups with one multi-row INSERT.
+
+    Returns the group ids in creation order.
+    """
+    groups = Group.__table__
+    return connection.execute(
+        groups.insert().returning(groups.c.id, sort_by_parameter_order=True),
+        [
+            {"name": f"{prefix}-{i}", "description": "Seeded"}
+            for i in range(count)
+        ],
+    ).scalars().all()
+
+
+def _problem_row(name, file):
+    if file is None:
+        return {
+            "name": name,
+            "filename": None,
+            "file_data": None,
+            "content_type": None,
+            "file_size": None,
+            "is_instances_self_contained": True,
+        }
+    filename, data = file
+    return {
+        "name": name,
+        "filename": filename,
+        "file_data": data,
+        "content_type": "text/plain",
+        "file_size": len(data),
+        "is_instances_self_contained": False,
+    }
+
+
+def insert_problems(connection, problems, files=None):
+    """Insert problems and link them to their groups.
+
+    problems maps each problem name to its group ids, and files optionally
+    maps a problem name to the (filename, data) of its problem file; problems
+    without one are self-contained. Returns the problem ids in the same order.
+    """
+    files = files or {}
+    table = Problem.__table__
+    problem_ids = connection.execute(
+        table.insert().returning(table.c.id, sort_by_parameter_order=True),
+        [_problem_row(name, files.get(name)) for name in problems],
+    ).scalars().all()
+    connection.execute(
+        problem_groups.insert(),
+        [
+            {"problem_id": problem_id, "group_id": group_id}
+            for problem_id, group_ids in zip(problem_ids, problems.values())
+            for group_id in group_ids
+        ],
+    )
+    return problem_ids
+
+
+def _instance_row(problem_id, filename, data):
+    return {
+        "problem_id": problem_id,
+        "filename": filename,
+        "file_data": data,
+        "content_type": "text/plain",
+        "file_size": len(data),
+    }
+
+
+def insert_instances(connection, problem_id, files):
+    """Insert instances of a problem from a mapping of filename to data.
+
+    Returns the instance ids in the same order.
+    """
+    table = Instance.__table__
+    return connection.execute(
+        table.insert().returning(table.c.id, sort_by_parameter_order=True),
+        [_instance_row(problem_id, name, data) for name, data in files.items()],
+    ).scalars().all()
+
+
+def seed_problems(connection, count):
+    """Insert a group and problems belonging to it.
+
+    Returns the group id and the problem ids in creation order.
+    """
+    [group_id] = seed_groups(connection, 1, prefix="seeded-problem-group")
+    problem_ids = insert_problems(
+        connection, {f"seeded-problem-{i}": [group_id] for i in range(count)}
+    )
+    return group_id, problem_ids
+
+
+@pytest.fixture(scope="module")
+def seeded_group_ids(engine):
+    """Ids of groups without problems, shared by the tests of a module.
+
+    Like seeded_solver_ids they survive each test's rollback, while links a
+    test adds to them (e.g. problems) are rolled back with the test.
+    """
+    with engine.begin() as connection:
+        ids = seed_groups(connection, SEEDED_GROUP_COUNT)
+
+    yield ids
+
+    groups = Group.__table__
+    with engine.begin() as connection:
+        connection.execute(groups.delete().where(groups.c.id.in_(ids)))
+
+
+@pytest.fixture(scope="module")
+def seeded_problem_ids(engine):
+    """Ids of problems in one group, shared by the tests of a module.
+
+    Like seeded_solver_ids they survive each test's rollback, so anything a
+    test adds to them (e.g. instances) is still rolled back with the test.
+    """
+    with engine.begin() as connection:
+        group_id, ids = seed_problems(connection, SEEDED_PROBLEM_COUNT)
+
+    yield ids
+
+    problems = Problem.__table__
+    with engine.begin() as connection:
+        connection.execute(
+            problem_groups.delete().where(problem_groups.c.problem_id.in_(ids))
+        )
+        connection.execute(problems.delete().where(problems.c.id.in_(ids)))
+        connection.execute(
+            Group.__table__.delete().where(Group.__table__.c.id == group_id)
+        )
+
+
+@pytest.fixture(scope="module")
+def seeded_instance(engine):
+    """An instance uploaded once for the read-only tests of a module.
+
+    It belongs to a problem of its own, so it never shows up in listings of
+    the seeded_problem_ids problems. Returns the instance row as a dict, with
+    the file content under file_data.
+    """
+    problems = Problem.__table__
+    instances = Instance.__table__
+    content = b"seeded instance content"
+    with engine.begin() as connection:
+        problem_id = connection.execute(
+            problems.insert().returning(problems.c.id),
+            {"name": "seeded-instance-problem", "is_instances_self_contained": False},
+        ).scalar_one()
+        instance = connection.execute(
+            instances.insert().returning(*instances.c),
+            _instance_row(problem_id, "seeded.dzn", content),
+        ).mappings().one()
+
+    yield dict(instance)
+
+    with engine.begin() as connection:
+        connection.execute(instances.delete().where(instances.c.id == instance["id"]))
+        connection.execute(problems.delete().where(problems.c.id == problem_id))
+
+
+@pytest.fixture
+def arrange_problems(connection):
+    """Insert problems inside the test's transaction without going through
+    the API, for tests whose subject is not problem creation.
+    """
+    return lambda problems, files=None: insert_problems(connection, problems, files)
+
+
+@pytest.fixture
+def arrange_instances(connection):
+    """Insert instances inside the test's transaction, like arrange_problems"""
+    return lambda problem_id, files: insert_instances(connection, problem_id, files)
+
+
+@pytest.fixture
+def retry_sleep():
+    """Skip the backoff of retry_transient, so retried calls run at once"""
+    with patch("src.spawner.retry.time.sleep") as sleep:
+        yield sleep
 
 
 @pytest.fixture
@@ -98,21 +414,17 @@ def auth(monkeypatch):
     return MockAuth(auth_config.client_id, monkeypatch)
 
 
-@pytest.fixture
-def authed_client_with_db(test_db, auth):
-    """Test client with DB and a token carrying all scopes — for business-logic tests."""
-    from src.main import app
-    from psp_auth.testing import MockToken
+def _reset_client(client):
+    global _current_db
+    _current_db = None
+    client.headers.pop("Authorization", None)
+    client.cookies.clear()
 
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
 
-    app.dependency_overrides[get_db] = override_get_db
+def _issue_all_scopes_token(auth):
+    from psp_auth.testing import MockToken
 
-    token = auth.issue_token(
+    return auth.issue_token(
         MockToken(
             scopes=[
                 "solvers:read",
@@ -125,26 +437,32 @@ def authed_client_with_db(test_db, auth):
         )
     )
 
-    with TestClient(app, headers=auth.auth_header(token)) as client:
-        yield client
-
-    app.dependency_overrides.clear()
-
 
 @pytest.fixture
-def client_with_db(test_db):
+def client_with_db(client, test_db):
     """Test client with test database for database tests"""
-    from src.main import app
+    global _current_db
+    _current_db = test_db
+    try:
+        yield client
+    finally:
+        _reset_client(client)
+
 
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
+@pytest.fixture
+def authed_client_with_db(client_with_db, auth):
+    """Test client with DB and a token carrying all scopes — for business-logic tests."""
+    client_with_db.headers.update(auth.auth_header(_issue_all_scopes_token(auth)))
+    return client_with_db
 
-    app.dependency_overrides[get_db] = override_get_db
 
-    with TestClient(app) as client:
+@pytest.fixture
+def authed_client(client, auth):
+    """Test client with a token carrying all scopes but no database — for tests
+    rejected by request validation before any query runs.
+    """
+    client.headers.update(auth.auth_header(_issue_all_scopes_token(auth)))
+    try:
         yield client
-
-    app.dependency_overrides.clear()
+    finally:
+        _reset_client(client)
@@ -1,12 +1,14 @@
 """Tests for groups API endpoints"""
 
-from src.models import Solver, SolverImage
+import pytest
+
+GROUPS_URL = "/api/solverdirector/v1/groups"
 
 
 def test_create_group(authed_client_with_db):
     """Test creating a new group"""
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "test-group", "description": "Test description"},
     )
     assert response.status_code == 201
@@ -19,12 +21,12 @@ def test_create_group(authed_client_with_db):
 def test_create_duplicate_group(authed_client_with_db):
     """Test creating a duplicate group fails"""
     authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "duplicate", "description": "First"},
     )
 
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "duplicate", "description": "Second"},
     )
     assert response.status_code == 400
@@ -33,16 +35,16 @@ def test_create_duplicate_group(authed_client_with_db):
 
 def test_get_all_groups(authed_client_with_db):
     """Test getting all groups"""
-    response = authed_client_with_db.get("/api/solverdirector/v1/groups")
+    response = authed_client_with_db.get(GROUPS_URL)
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
 
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "test", "description": "test description"},
     )
-    response = authed_client_with_db.get("api/solverdirector/v1/groups")
+    response = authed_client_with_db.get(GROUPS_URL)
     assert response.status_code == 200
     data = response.json()
     assert len(data) >= 1
@@ -51,109 +53,81 @@ def test_get_all_groups(authed_client_with_db):
 def test_get_group_by_id(authed_client_with_db):
     """Test getting a specific group"""
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "get-test", "description": "Get test"},
     )
     group_id = create_response.json()["id"]
 
-    response = authed_client_with_db.get(f"/api/solverdirector/v1/groups/{group_id}")
+    response = authed_client_with_db.get(f"{GROUPS_URL}/{group_id}")
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == group_id
     assert data["name"] == "get-test"
 
 
-def test_get_nonexistent_group(authed_client_with_db):
-    """Test getting a group that doesn't exist"""
-    response = authed_client_with_db.get("/api/solverdirector/v1/groups/99999")
+@pytest.mark.parametrize("method", ["get", "delete"])
+def test_nonexistent_group(authed_client_with_db, method):
+    """Test getting or deleting a group that doesn't exist"""
+    response = authed_client_with_db.request(
+        method, f"{GROUPS_URL}/99999"
+    )
     assert response.status_code == 404
 
 
-def test_create_group_missing_name(authed_client_with_db):
-    """Test creating group without name fails"""
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups", json={"description": "No name provided"}
-    )
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"description": "No name provided"},
+        {"name": "", "description": "Empty name"},
+        {"name": "   ", "description": "Whitespace name"},
+        {"name": 123, "description": "Name is number"},
+        {"name": None, "description": "Null name"},
+        {"name": "test", "description": 123},
+    ],
+    ids=[
+        "missing-name",
+        "empty-name",
+        "whitespace-name",
+        "invalid-name-type",
+        "null-name",
+        "invalid-description-type",
+    ],
+)
+def test_create_group_invalid(authed_client, payload):
+    """Test creating group with an invalid payload fails validation"""
+    response = authed_client.post(GROUPS_URL, json=payload)
     assert response.status_code == 422
     assert "detail" in response.json()
 
 
-def test_create_group_empty_name(authed_client_with_db):
-    """Test creating group with empty name fails"""
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups", json={"name": "", "description": "Empty name"}
-    )
-    assert response.status_code == 422
-
-
-def test_create_group_whitespace_name(authed_client_with_db):
-    """Test creating group with whitespace-only name fails"""
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "   ", "description": "Whitespace name"},
-    )
-    assert response.status_code == 422
-
-
-def test_create_group_invalid_name_type(authed_client_with_db):
-    """Test creating group with wrong name data type"""
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": 123, "description": "Name is number"},
-    )
-    assert response.status_code == 422
-
-
-def test_create_group_null_name(authed_client_with_db):
-    """Test creating group with null name fails"""
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups", json={"name": None, "description": "Null name"}
-    )
-    assert response.status_code == 422
-
-
-def test_create_group_invalid_description_type(authed_client_with_db):
-    """Test creating group with wrong description data type"""
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups", json={"name": "test", "description": 123}
-    )
-    assert response.status_code == 422
-
-
 def test_delete_group(authed_client_with_db):
     """Test deleting an existing group"""
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "delete-test", "description": "To be deleted"},
     )
     group_id = create_response.json()["id"]
 
-    response = authed_client_with_db.delete(f"/api/solverdirector/v1/groups/{group_id}")
+    response = authed_client_with_db.delete(f"{GROUPS_URL}/{group_id}")
     assert response.status_code == 204
 
     # verify it is gone
-    get_response = authed_client_with_db.get(f"/api/solverdirector/v1/groups/{group_id}")
+    get_response = authed_client_with_db.get(f"{GROUPS_URL}/{group_id}")
     assert get_response.status_code == 404
 
 
-def test_delete_nonexistent_group(authed_client_with_db):
-    """Test deleting a non-existent group returns 404"""
-    response = authed_client_with_db.delete("/api/solverdirector/v1/groups/99999")
-    assert response.status_code == 404
-
-
 def test_delete_group_twice(authed_client_with_db):
     """Test deleting the same group twice fails on second attempt"""
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "double-delete", "description": "Delete twice"},
     )
     group_id = create_response.json()["id"]
 
-    response = authed_client_with_db.delete(f"/api/solverdirector/v1/groups/{group_id}")
+    response = authed_client_with_db.delete(f"{GROUPS_URL}/{group_id}")
     assert response.status_code == 204
 
-    response = authed_client_with_db.delete(f"/api/solverdirector/v1/groups/{group_id}")
+    response = authed_client_with_db.delete(f"{GROUPS_URL}/{group_id}")
     assert response.status_code == 404
 
 
@@ -162,14 +136,14 @@ def test_update_group_name_only(authed_client_with_db, test_db):
     """Test updating only group name"""
     # Create group
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Original Name", "description": "Test"},
     )
     group_id = create_response.json()["id"]
 
     # Update name only
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/groups/{group_id}",
+        f"{GROUPS_URL}/{group_id}",
         json={"name": "Updated Name"},
     )
     assert update_response.status_code == 200
@@ -182,14 +156,14 @@ def test_update_group_description_only(authed_client_with_db, test_db):
     """Test updating only group description"""
     # Create group
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Test Group", "description": "Original Description"},
     )
     group_id = create_response.json()["id"]
 
     # Update description only
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/groups/{group_id}",
+        f"{GROUPS_URL}/{group_id}",
         json={"description": "Updated Description"},
     )
     assert update_response.status_code == 200
@@ -198,94 +172,66 @@ def test_update_group_description_only(authed_client_with_db, test_db):
     assert data["description"] == "Updated Description"
 
 
-def test_update_group_solvers_only(authed_client_with_db, test_db):
+def test_update_group_solvers_only(authed_client_with_db, seeded_solver_ids):
     """Test updating only group solvers"""
     # Create group
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Test Group", "description": "Test"},
     )
     group_id = create_response.json()["id"]
 
-    # Create solvers
-    solver_image1 = SolverImage(
-        image_name="solver1", image_path="ghcr.io/portfolio-solver-platform/solver1:latest"
-    )
-    test_db.add(solver_image1)
-    test_db.flush()
-
-    solver1 = Solver(name="solver1", solver_image_id=solver_image1.id)
-    test_db.add(solver1)
-
-    solver_image2 = SolverImage(
-        image_name="solver2", image_path="ghcr.io/portfolio-solver-platform/solver2:latest"
-    )
-    test_db.add(solver_image2)
-    test_db.flush()
-
-    solver2 = Solver(name="solver2", solver_image_id=solver_image2.id)
-    test_db.add(solver2)
-    test_db.commit()
-
     # Update solvers only
+    solver_ids = seeded_solver_ids[:2]
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/groups/{group_id}",
-        json={"solver_ids": [solver1.id, solver2.id]},
+        f"{GROUPS_URL}/{group_id}",
+        json={"solver_ids": solver_ids},
     )
     assert update_response.status_code == 200
     data = update_response.json()
     assert data["name"] == "Test Group"  # Unchanged
-    assert set(data["solver_ids"]) == {solver1.id, solver2.id}
+    assert set(data["solver_ids"]) == set(solver_ids)
 
 
-def test_update_group_all_fields(authed_client_with_db, test_db):
+def test_update_group_all_fields(authed_client_with_db, seeded_solver_ids):
     """Test updating name, description, and solvers"""
     # Create group
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Original", "description": "Original Desc"},
     )
     group_id = create_response.json()["id"]
 
-    # Create solver
-    solver_image = SolverImage(
-        image_name="solver", image_path="ghcr.io/portfolio-solver-platform/solver:latest"
-    )
-    test_db.add(solver_image)
-    test_db.flush()
-
-    solver = Solver(name="solver", solver_image_id=solver_image.id)
-    test_db.add(solver)
-    test_db.commit()
+    solver_id = seeded_solver_ids[0]
 
     # Update all fields
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/groups/{group_id}",
+        f"{GROUPS_URL}/{group_id}",
         json={
             "name": "Updated",
             "description": "Updated Desc",
-            "solver_ids": [solver.id],
+            "solver_ids": [solver_id],
         },
     )
     assert update_response.status_code == 200
     data = update_response.json()
     assert data["name"] == "Updated"
     assert data["description"] == "Updated Desc"
-    assert data["solver_ids"] == [solver.id]
+    assert data["solver_ids"] == [solver_id]
 
 
 def test_update_group_empty_name(authed_client_with_db, test_db):
     """Test updating with empty name fails"""
     # Create group
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Original", "description": "Test"},
     )
     group_id = create_response.json()["id"]
 
     # Try to update with empty name
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/groups/{group_id}",
+        f"{GROUPS_URL}/{group_id}",
         json={"name": "   "},
     )
     assert update_response.status_code == 422
@@ -295,19 +241,19 @@ def test_update_group_duplicate_name(authed_client_with_db, test_db):
     """Test updating to duplicate name fails"""
     # Create two groups
     authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Group 1", "description": "Test"},
     )
 
     create_response2 = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Group 2", "description": "Test"},
     )
     group2_id = create_response2.json()["id"]
 
     # Try to update group 2 to have same name as group 1
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/groups/{group2_id}",
+        f"{GROUPS_URL}/{group2_id}",
         json={"name": "Group 1"},
     )
     assert update_response.status_code == 400
@@ -318,74 +264,67 @@ def test_update_group_nonexistent_solvers(authed_client_with_db, test_db):
     """Test updating with non-existent solvers fails"""
     # Create group
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Test Group", "description": "Test"},
     )
     group_id = create_response.json()["id"]
 
     # Try to update with non-existent solver
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/groups/{group_id}",
+        f"{GROUPS_URL}/{group_id}",
         json={"solver_ids": [99999]},
     )
     assert update_response.status_code == 404
     assert "99999" in update_response.json()["detail"]
 
 
-def test_update_group_duplicate_solver_ids(authed_client_with_db, test_db):
+def test_update_group_duplicate_solver_ids(authed_client_with_db, seeded_solver_ids):
     """Test updating with duplicate solver_ids deduplicates them"""
     # Create group
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Test Group", "description": "Test"},
     )
     group_id = create_response.json()["id"]
 
-    # Create solver
-    solver_image = SolverImage(
-        image_name="solver", image_path="ghcr.io/portfolio-solver-platform/solver:latest"
-    )
-    test_db.add(solver_image)
-    test_db.flush()
-
-    solver = Solver(name="solver", solver_image_id=solver_image.id)
-    test_db.add(solver)
-    test_db.commit()
+    solver_id = seeded_solver_ids[0]
 
     # Update with duplicate solver_ids
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/groups/{group_id}",
-        json={"solver_ids": [solver.id, solver.id, solver.id]},
+        f"{GROUPS_URL}/{group_id}",
+        json={"solver_ids": [solver_id, solver_id, solver_id]},
     )
     assert update_response.status_code == 200
     data = update_response.json()
     # Should be deduplicated
-    assert data["solver_ids"] == [solver.id]
+    assert data["solver_ids"] == [solver_id]
 
 
 def test_update_nonexistent_group(authed_client_with_db, test_db):
     """Test updating non-existent group fails"""
     update_response = authed_client_with_db.patch(
-        "/api/solverdirector/v1/groups/99999",
+        f"{GROUPS_URL}/99999",
         json={"name": "New Name"},
     )
     assert update_response.status_code == 404
-    assert "not found" in update_response.json()["detail"].lower()
+    assert "not found" in update_response.json()["detail"]
 
 
 def test_update_group_no_fields(authed_client_with_db, test_db):
     """Test updating with no fields fails"""
     # Create group
     create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
+        GROUPS_URL,
         json={"name": "Test Group", "description": "Test"},
     )
     group_id = create_response.json()["id"]
 
     # Try to update with no fields
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/groups/{group_id}",
+        f"{GROUPS_URL}/{group_id}",
         json={},
     )
     assert update_response.status_code == 422
-    assert "at least one field" in update_response.json()["detail"].lower()
+    assert update_response.json()["detail"] == (
+        "At least one field must be provided for update"
+    )
@@ -2,27 +2,24 @@
 
 from io import BytesIO
 
+import pytest
 
-def test_upload_instance(authed_client_with_db):
-    """Test uploading an instance file"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+PROBLEMS_URL = "/api/solverdirector/v1/problems"
+DZN_BYTES = b"This is a test instance file"
+
+
+def _dzn(name="instance.dzn", data=DZN_BYTES):
+    """Multipart files argument for uploading an instance"""
+    return {"file": (name, BytesIO(data), "text/plain")}
 
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
+
+def test_upload_instance(authed_client_with_db, seeded_problem_ids):
+    """Test uploading an instance file"""
+    problem_id = seeded_problem_ids[0]
 
     # Upload instance
-    file_content = b"This is a test instance file"
     response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances",
-        files={"file": ("instance.dzn", BytesIO(file_content), "text/plain")},
+        f"{PROBLEMS_URL}/{problem_id}/instances", files=_dzn()
     )
 
     assert response.status_code == 201
@@ -30,96 +27,68 @@ def test_upload_instance(authed_client_with_db):
     assert data["problem_id"] == problem_id
     assert data["filename"] == "instance.dzn"
     assert data["content_type"] == "text/plain"
-    assert data["file_size"] == len(file_content)
+    assert data["file_size"] == len(DZN_BYTES)
     assert "id" in data
     assert "uploaded_at" in data
 
 
-def test_upload_instance_to_nonexistent_problem(authed_client_with_db):
-    """Test uploading instance to non-existent problem returns 404"""
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems/99999/instances",
-        files={"file": ("instance.dzn", BytesIO(b"content"), "text/plain")},
-    )
+@pytest.mark.parametrize(
+    "method,path",
+    [
+        ("post", "/99999/instances"),
+        ("get", "/99999/instances"),
+        ("delete", "/99999/instances/1"),
+    ],
+    ids=["upload", "list", "delete"],
+)
+def test_instances_nonexistent_problem(authed_client_with_db, method, path):
+    """Test instance endpoints for a non-existent problem return 404"""
+    kwargs = {}
+    if method == "post":
+        kwargs["files"] = _dzn()
+    response = authed_client_with_db.request(method, f"{PROBLEMS_URL}{path}", **kwargs)
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert "not found" in response.json()["detail"]
 
 
-def test_upload_instance_empty_file(authed_client_with_db):
+def test_upload_instance_empty_file(authed_client_with_db, seeded_problem_ids):
     """Test uploading empty instance file fails"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
+    problem_id = seeded_problem_ids[0]
 
     # Try to upload empty file
     response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances",
-        files={"file": ("empty.dzn", BytesIO(b""), "text/plain")},
+        f"{PROBLEMS_URL}/{problem_id}/instances",
+        files=_dzn("empty.dzn", b""),
     )
     assert response.status_code == 422
-    assert "empty" in response.json()["detail"].lower()
+    assert "empty" in response.json()["detail"]
 
 
-def test_upload_instance_missing_file(authed_client_with_db):
+def test_upload_instance_missing_file(authed_client_with_db, seeded_problem_ids):
     """Test uploading instance without file fails"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
+    problem_id = seeded_problem_ids[0]
 
     # Try to upload without file
-    response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances"
-    )
+    response = authed_client_with_db.post(f"{PROBLEMS_URL}/{problem_id}/instances")
     assert response.status_code == 422
 
 
-def test_get_instances_for_problem(authed_client_with_db):
+def test_get_instances_for_problem(authed_client_with_db, seeded_problem_ids):
     """Test getting all instances for a specific problem"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
+    problem_id = seeded_problem_ids[0]
 
     # Upload two instances
     authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances",
-        files={"file": ("instance1.dzn", BytesIO(b"content1"), "text/plain")},
+        f"{PROBLEMS_URL}/{problem_id}/instances",
+        files=_dzn("instance1.dzn", b"content1"),
     )
     authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances",
-        files={"file": ("instance2.dzn", BytesIO(b"content2"), "text/plain")},
+        f"{PROBLEMS_URL}/{problem_id}/instances",
+        files=_dzn("instance2.dzn", b"content2"),
     )
 
     # Get all instances for problem
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances"
-    )
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}/instances")
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 2
@@ -129,73 +98,33 @@ def test_get_instances_for_problem(authed_client_with_db):
     assert data[1]["problem_id"] == problem_id
 
 
-def test_get_instances_empty_problem(authed_client_with_db):
+def test_get_instances_empty_problem(authed_client_with_db, seeded_problem_ids):
     """Test getting instances for problem with no instances returns empty list"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
+    problem_id = seeded_problem_ids[0]
 
     # Get instances - should be empty
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances"
-    )
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}/instances")
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 0
 
 
-def test_get_instances_nonexistent_problem(authed_client_with_db):
-    """Test getting instances for non-existent problem returns 404"""
-    response = authed_client_with_db.get("/api/solverdirector/v1/problems/99999/instances")
-    assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
-
-
-def test_get_instances_multiple_problems(authed_client_with_db):
+def test_get_instances_multiple_problems(authed_client_with_db, seeded_problem_ids):
     """Test that instances are correctly filtered by problem"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    # Create two problems
-    problem1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 1", "group_ids": [group_id]},
-    )
-    problem1_id = problem1_response.json()["id"]
-
-    problem2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 2", "group_ids": [group_id]},
-    )
-    problem2_id = problem2_response.json()["id"]
+    problem1_id, problem2_id = seeded_problem_ids
 
     # Add instances to both problems
     authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem1_id}/instances",
-        files={"file": ("p1_instance.dzn", BytesIO(b"content1"), "text/plain")},
+        f"{PROBLEMS_URL}/{problem1_id}/instances",
+        files=_dzn("p1_instance.dzn", b"content1"),
     )
     authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem2_id}/instances",
-        files={"file": ("p2_instance.dzn", BytesIO(b"content2"), "text/plain")},
+        f"{PROBLEMS_URL}/{problem2_id}/instances",
+        files=_dzn("p2_instance.dzn", b"content2"),
     )
 
     # Get instances for problem1 - should only have 1
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem1_id}/instances"
-    )
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem1_id}/instances")
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 1
@@ -203,297 +132,106 @@ def test_get_instances_multiple_problems(authed_client_with_db):
     assert data[0]["problem_id"] == problem1_id
 
 
-def test_get_instance_metadata(authed_client_with_db):
+def test_get_instance_metadata(authed_client_with_db, seeded_instance):
     """Test getting instance metadata without file content"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
-
-    # Upload instance
-    upload_response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances",
-        files={"file": ("test.dzn", BytesIO(b"test content"), "text/plain")},
-    )
-    instance_id = upload_response.json()["id"]
+    problem_id = seeded_instance["problem_id"]
+    instance_id = seeded_instance["id"]
 
     # Get metadata
     response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances/{instance_id}"
+        f"{PROBLEMS_URL}/{problem_id}/instances/{instance_id}"
     )
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == instance_id
     assert data["problem_id"] == problem_id
-    assert data["filename"] == "test.dzn"
+    assert data["filename"] == "seeded.dzn"
     assert "file_data" not in data  # Should not include binary data
 
 
-def test_get_nonexistent_instance(authed_client_with_db):
-    """Test getting non-existent instance returns 404"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
+@pytest.mark.parametrize(
+    "method,suffix",
+    [("get", ""), ("get", "/file"), ("delete", "")],
+    ids=["metadata", "download", "delete"],
+)
+def test_nonexistent_instance(
+    authed_client_with_db, seeded_problem_ids, method, suffix
+):
+    """Test instance endpoints for a non-existent instance return 404"""
+    problem_id = seeded_problem_ids[0]
 
-    # Try to get non-existent instance
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances/99999"
+    response = authed_client_with_db.request(
+        method,
+        f"{PROBLEMS_URL}/{problem_id}/instances/99999{suffix}",
     )
     assert response.status_code == 404
-
-
-def test_get_instance_wrong_problem(authed_client_with_db):
-    """Test getting instance from wrong problem returns 404"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    # Create two problems
-    problem1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 1", "group_ids": [group_id]},
-    )
-    problem1_id = problem1_response.json()["id"]
-
-    problem2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 2", "group_ids": [group_id]},
-    )
-    problem2_id = problem2_response.json()["id"]
-
-    # Upload instance to problem 1
-    upload_response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem1_id}/instances",
-        files={"file": ("instance.dzn", BytesIO(b"content"), "text/plain")},
-    )
-    instance_id = upload_response.json()["id"]
-
-    # Try to get instance from problem 2 - should fail
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem2_id}/instances/{instance_id}"
+    assert "not found" in response.json()["detail"]
+
+
+@pytest.mark.parametrize(
+    "method,suffix",
+    [("get", ""), ("get", "/file"), ("delete", "")],
+    ids=["metadata", "download", "delete"],
+)
+def test_instance_wrong_problem(
+    authed_client_with_db, seeded_instance, seeded_problem_ids, method, suffix
+):
+    """Test instance endpoints under the wrong problem return 404"""
+    problem_id = seeded_instance["problem_id"]
+    instance_id = seeded_instance["id"]
+    wrong_problem_id = seeded_problem_ids[0]
+
+    # Try to reach the instance through another problem - should fail
+    response = authed_client_with_db.request(
+        method,
+        f"{PROBLEMS_URL}/{wrong_problem_id}/instances/{instance_id}{suffix}",
     )
     assert response.status_code == 404
 
-
-def test_download_instance_file(authed_client_with_db):
-    """Test downloading instance file"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
+    # Verify instance still exists under its own problem
+    get_response = authed_client_with_db.get(
+        f"{PROBLEMS_URL}/{problem_id}/instances/{instance_id}"
     )
-    group_id = group_response.json()["id"]
+    assert get_response.status_code == 200
 
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
 
-    # Upload instance
-    file_content = b"This is the actual instance content"
-    upload_response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances",
-        files={"file": ("download.dzn", BytesIO(file_content), "text/plain")},
-    )
-    instance_id = upload_response.json()["id"]
+def test_download_instance_file(authed_client_with_db, seeded_instance):
+    """Test downloading instance file"""
+    problem_id = seeded_instance["problem_id"]
+    instance_id = seeded_instance["id"]
 
     # Download file
     response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances/{instance_id}/file"
+        f"{PROBLEMS_URL}/{problem_id}/instances/{instance_id}/file"
     )
     assert response.status_code == 200
-    assert response.content == file_content
+    assert response.content == seeded_instance["file_data"]
     assert response.headers["content-type"].startswith("text/plain")
     assert (
-        'attachment; filename="download.dzn"' in response.headers["content-disposition"]
-    )
-
-
-def test_download_nonexistent_instance(authed_client_with_db):
-    """Test downloading non-existent instance returns 404"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
-
-    # Try to download non-existent instance
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances/99999/file"
-    )
-    assert response.status_code == 404
-
-
-def test_download_instance_wrong_problem(authed_client_with_db):
-    """Test downloading instance from wrong problem returns 404"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    # Create two problems
-    problem1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 1", "group_ids": [group_id]},
-    )
-    problem1_id = problem1_response.json()["id"]
-
-    problem2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 2", "group_ids": [group_id]},
-    )
-    problem2_id = problem2_response.json()["id"]
-
-    # Upload instance to problem 1
-    upload_response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem1_id}/instances",
-        files={"file": ("instance.dzn", BytesIO(b"content"), "text/plain")},
-    )
-    instance_id = upload_response.json()["id"]
-
-    # Try to download instance from problem 2 - should fail
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem2_id}/instances/{instance_id}/file"
+        'attachment; filename="seeded.dzn"' in response.headers["content-disposition"]
     )
-    assert response.status_code == 404
 
 
 # DELETE /problems/{problem_id}/instances/{instance_id} tests
-def test_delete_instance_success(authed_client_with_db):
+def test_delete_instance_success(authed_client_with_db, seeded_problem_ids):
     """Test successfully deleting an instance"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
+    problem_id = seeded_problem_ids[0]
 
     # Upload instance
-    instance_content = b"instance content"
     upload_response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances",
-        files={"file": ("instance.dzn", BytesIO(instance_content), "text/plain")},
+        f"{PROBLEMS_URL}/{problem_id}/instances",
+        files=_dzn(),
     )
     instance_id = upload_response.json()["id"]
 
     # Delete instance
     delete_response = authed_client_with_db.delete(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances/{instance_id}"
+        f"{PROBLEMS_URL}/{problem_id}/instances/{instance_id}"
     )
     assert delete_response.status_code == 204
 
     # Verify instance no longer exists
     get_response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances/{instance_id}"
+        f"{PROBLEMS_URL}/{problem_id}/instances/{instance_id}"
     )
     assert get_response.status_code == 404
-
-
-def test_delete_instance_wrong_problem(authed_client_with_db):
-    """Test deleting instance with wrong problem_id fails"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    # Create two problems
-    problem1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 1", "group_ids": [group_id]},
-    )
-    problem1_id = problem1_response.json()["id"]
-
-    problem2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 2", "group_ids": [group_id]},
-    )
-    problem2_id = problem2_response.json()["id"]
-
-    # Upload instance to problem 1
-    upload_response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem1_id}/instances",
-        files={"file": ("instance.dzn", BytesIO(b"content"), "text/plain")},
-    )
-    instance_id = upload_response.json()["id"]
-
-    # Try to delete instance using problem 2's ID - should fail
-    delete_response = authed_client_with_db.delete(
-        f"/api/solverdirector/v1/problems/{problem2_id}/instances/{instance_id}"
-    )
-    assert delete_response.status_code == 404
-
-    # Verify instance still exists under problem 1
-    get_response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem1_id}/instances/{instance_id}"
-    )
-    assert get_response.status_code == 200
-
-
-def test_delete_nonexistent_instance(authed_client_with_db):
-    """Test deleting a non-existent instance returns 404"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    problem_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = problem_response.json()["id"]
-
-    # Try to delete non-existent instance
-    delete_response = authed_client_with_db.delete(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances/99999"
-    )
-    assert delete_response.status_code == 404
-    assert "not found" in delete_response.json()["detail"].lower()
-
-
-def test_delete_instance_nonexistent_problem(authed_client_with_db):
-    """Test deleting instance with non-existent problem returns 404"""
-    delete_response = authed_client_with_db.delete(
-        "/api/solverdirector/v1/problems/99999/instances/1"
-    )
-    assert delete_response.status_code == 404
-    assert "not found" in delete_response.json()["detail"].lower()
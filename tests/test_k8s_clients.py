@@ -0,0 +1,35 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.config import Config
+from src.spawner import k8s_clients
+
+
+@pytest.fixture(autouse=True)
+def clear_clients():
+    k8s_clients.api_client.cache_clear()
+    k8s_clients.core_v1.cache_clear()
+    yield
+    k8s_clients.api_client.cache_clear()
+    k8s_clients.core_v1.cache_clear()
+
+
+def test_config_is_loaded_once():
+    with patch("src.spawner.k8s_clients.config.load_incluster_config") as load:
+        first = k8s_clients.core_v1()
+        second = k8s_clients.core_v1()
+
+    assert first is second
+    assert first.api_client is k8s_clients.api_client()
+    load.assert_called_once()
+
+
+def test_connection_pool_is_sized_for_concurrent_calls():
+    with patch("src.spawner.k8s_clients.config.load_incluster_config"):
+        api_client = k8s_clients.api_client()
+
+    assert (
+        api_client.configuration.connection_pool_maxsize
+        == Config.Kubernetes.CONNECTION_POOL_MAXSIZE
+    )
@@ -0,0 +1,187 @@
+import json
+
+from src.config import Config
+from src.spawner.manifests import (
+    create_data_gatherer_pod_manifest,
+    create_data_gatherer_service_manifest,
+    create_solver_controller_pod_manifest,
+    create_solver_creator_role_binding_manifest,
+    create_solver_quota_manifest,
+)
+
+
+def test_quota_rounds_down_to_whole_units():
+    quota = create_solver_quota_manifest("project-1-solvers", 2.5, 4.0)
+
+    assert quota["metadata"]["namespace"] == "project-1-solvers"
+    assert quota["spec"]["hard"] == {
+        "requests.cpu": "2",
+        "requests.memory": "4Gi",
+        "limits.cpu": "2",
+        "limits.memory": "4Gi",
+    }
+
+
+def test_role_binding_grants_project_service_account():
+    binding = create_solver_creator_role_binding_manifest("project-1-solvers", "project-1")
+
+    assert binding["metadata"]["namespace"] == "project-1-solvers"
+    assert binding["subjects"] == [
+        {"kind": "ServiceAccount", "name": "default", "namespace": "project-1"}
+    ]
+    assert binding["roleRef"]["name"] == "solver-creator"
+
+
+def test_solver_controller_pod_env():
+    pod = create_solver_controller_pod_manifest(
+        "project-1", "control", "results", timeout=60, max_replicas=3
+    )
+
+    env = {e["name"]: e.get("value") for e in pod["spec"]["containers"][0]["env"]}
+    assert env["SOLVERS_NAMESPACE"] == "project-1-solvers"
+    assert env["CONTROL_QUEUE"] == "control"
+    assert env["PROJECT_SOLVER_RESULT_QUEUE"] == "results"
+    assert env["MAX_TOTAL_SOLVER_REPLICAS"] == "3"
+    assert env["SOLVER_TIMEOUT"] == "60"
+
+
+def test_manifests_are_not_shared_between_calls():
+    service = create_data_gatherer_service_manifest()
+    service["metadata"]["labels"]["extra"] = "label"
+    pod = create_solver_controller_pod_manifest(
+        "project-1", "control", "results", timeout=60, max_replicas=3
+    )
+    pod["spec"]["securityContext"]["runAsNonRoot"] = False
+
+    assert "extra" not in create_data_gatherer_service_manifest()["metadata"]["labels"]
+    other = create_solver_controller_pod_manifest(
+        "project-2", "control", "results", timeout=60, max_replicas=3
+    )
+    assert other["spec"]["securityContext"]["runAsNonRoot"] is True
+
+
+RABBITMQ_ENV = [
+    {"name": "RABBITMQ_HOST", "value": Config.RabbitMQ.HOST},
+    {"name": "RABBITMQ_PORT", "value": str(Config.RabbitMQ.PORT)},
+    {"name": "RABBITMQ_USER", "value": Config.RabbitMQ.USER},
+    {"name": "RABBITMQ_PASSWORD", "value": Config.RabbitMQ.PASSWORD},
+]
+POD_SECURITY_CONTEXT = {
+    "runAsNonRoot": True,
+    "seccompProfile": {"type": "RuntimeDefault"},
+}
+CONTAINER_SECURITY_CONTEXT = {
+    "allowPrivilegeEscalation": False,
+    "readOnlyRootFilesystem": True,
+    "capabilities": {"drop": ["ALL"]},
+}
+
+
+def test_solver_controller_pod_manifest_is_pinned():
+    pod = create_solver_controller_pod_manifest(
+        "project-1", "control", "results", timeout=60, max_replicas=3
+    )
+
+    # Compared as JSON so that key and env order are pinned too
+    assert json.dumps(pod) == json.dumps(
+        {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {
+                "name": "solver-controller",
+                "labels": {"solver_controller_id": "solver-controller"},
+            },
+            "spec": {
+                "securityContext": POD_SECURITY_CONTEXT,
+                "containers": [
+                    {
+                        "name": "solver-controller",
+                        "image": Config.SolverController.IMAGE,
+                        "imagePullPolicy": "IfNotPresent",
+                        "ports": [
+                            {"containerPort": Config.SolverController.CONTAINER_PORT}
+                        ],
+                        "env": [
+                            {"name": "PROJECT_SOLVER_RESULT_QUEUE", "value": "results"},
+                            {"name": "PROJECT_ID", "value": "project-1"},
+                            {"name": "SOLVERS_NAMESPACE", "value": "project-1-solvers"},
+                            {"name": "CONTROL_QUEUE", "value": "control"},
+                            {"name": "MAX_TOTAL_SOLVER_REPLICAS", "value": "3"},
+                            {
+                                "name": "KEDA_QUEUE_LENGTH",
+                                "value": Config.Keda.KEDA_QUEUE_LENGTH,
+                            },
+                            {"name": "SOLVER_TIMEOUT", "value": "60"},
+                            *RABBITMQ_ENV,
+                            {
+                                "name": "KEYCLOAK_CLIENT_ID",
+                                "valueFrom": {
+                                    "secretKeyRef": {
+                                        "name": "psp-auth-client",
+                                        "key": "id",
+                                    }
+                                },
+                            },
+                            {
+                                "name": "KEYCLOAK_CLIENT_SECRET",
+                                "valueFrom": {
+                                    "secretKeyRef": {
+                                        "name": "psp-auth-client",
+                                        "key": "secret",
+                                    }
+                                },
+                            },
+                        ],
+                        "volumeMounts": [{"name": "tmp", "mountPath": "/tmp"}],  # nosec
+                        "securityContext": CONTAINER_SECURITY_CONTEXT,
+                    }
+                ],
+                "volumes": [{"name": "tmp", "emptyDir": {}}],
+            },
+        }
+    )
+
+
+def test_data_gatherer_pod_manifest_is_pinned():
+    pod = create_data_gatherer_pod_manifest(
+        "project-1", "control", "director", "results", "director-results"
+    )
+
+    assert json.dumps(pod) == json.dumps(
+        {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {
+                "name": "data-gatherer",
+                "labels": {"data_gatherer_id": "data-gatherer"},
+            },
+            "spec": {
+                "securityContext": POD_SECURITY_CONTEXT,
+                "containers": [
+                    {
+                        "name": "data-gatherer",
+                        "image": Config.DataGatherer.IMAGE,
+                        "imagePullPolicy": "IfNotPresent",
+                        "ports": [
+                            {"containerPort": Config.DataGatherer.CONTAINER_PORT}
+                        ],
+                        "env": [
+                            {"name": "DEBUG", "value": str(Config.App.DEBUG)},
+                            {"name": "PROJECT_ID", "value": "project-1"},
+                            {"name": "CONTROL_QUEUE", "value": "control"},
+                            {"name": "DIRECTOR_QUEUE", "value": "director"},
+                            {"name": "PROJECT_SOLVER_RESULT_QUEUE", "value": "results"},
+                            {
+                                "name": "SOLVER_DIRECTOR_RESULT_QUEUE",
+                                "value": "director-results",
+                            },
+                            *RABBITMQ_ENV,
+                        ],
+                        "volumeMounts": [{"name": "tmp", "mountPath": "/tmp"}],  # nosec
+                        "securityContext": CONTAINER_SECURITY_CONTEXT,
+                    }
+                ],
+                "volumes": [{"name": "tmp", "emptyDir": {}}],
+            },
+        }
+    )
@@ -2,19 +2,30 @@
 
 from io import BytesIO
 
+import pytest
+from pydantic import ValidationError
 
-def test_upload_problem(authed_client_with_db):
+from src.routers.api.problems import ProblemCreateRequest
+
+PROBLEMS_URL = "/api/solverdirector/v1/problems"
+GROUPS_URL = "/api/solverdirector/v1/groups"
+
+FILE_BYTES = b"content"
+
+
+def _upload(name, data=FILE_BYTES):
+    """Multipart files argument for uploading a problem or instance file"""
+    return {"file": (name, BytesIO(data), "text/plain")}
+
+
+def test_upload_problem(authed_client_with_db, seeded_group_ids):
     """Test uploading a problem file"""
 
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
     # Step 1: Create problem with JSON
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
+        PROBLEMS_URL,
         json={"name": "Test Problem", "group_ids": [group_id]},
     )
     assert response.status_code == 201
@@ -23,8 +34,8 @@ def test_upload_problem(authed_client_with_db):
     # Step 2: Upload file
     file_content = b"This is a test problem file"
     file_response = authed_client_with_db.put(
-        f"/api/solverdirector/v1/problems/{problem_id}/file",
-        files={"file": ("problem.txt", BytesIO(file_content), "text/plain")},
+        f"{PROBLEMS_URL}/{problem_id}/file",
+        files=_upload("problem.txt", file_content),
     )
 
     assert file_response.status_code == 200
@@ -39,30 +50,21 @@ def test_upload_problem(authed_client_with_db):
     assert "uploaded_at" in data
 
 
-def test_get_problem_metadata(authed_client_with_db):
+def test_get_problem_metadata(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test getting problem metadata without file content"""
 
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    # Create problem
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Metadata Test", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
-    # Upload file
-    authed_client_with_db.put(
-        f"/api/solverdirector/v1/problems/{problem_id}/file",
-        files={"file": ("test.txt", BytesIO(b"content"), "text/plain")},
+    # Create problem with a file
+    [problem_id] = arrange_problems(
+        {"Metadata Test": [group_id]},
+        files={"Metadata Test": ("test.txt", FILE_BYTES)},
     )
 
     # Get metadata
-    response = authed_client_with_db.get(f"/api/solverdirector/v1/problems/{problem_id}")
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}")
     assert response.status_code == 200
     data = response.json()
     assert data["id"] == problem_id
@@ -72,31 +74,21 @@ def test_get_problem_metadata(authed_client_with_db):
     assert "file_data" not in data  # Should not include binary data
 
 
-def test_download_problem_file(authed_client_with_db):
+def test_download_problem_file(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test downloading problem file"""
-    # Create group and upload problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    # Create problem
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Download Test", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
-    # Upload file
+    # Create problem with a file
     file_content = b"This is the actual problem content"
-    authed_client_with_db.put(
-        f"/api/solverdirector/v1/problems/{problem_id}/file",
-        files={"file": ("download.txt", BytesIO(file_content), "text/plain")},
+    [problem_id] = arrange_problems(
+        {"Download Test": [group_id]},
+        files={"Download Test": ("download.txt", file_content)},
     )
 
     # Download file
-    response = authed_client_with_db.get(f"/api/solverdirector/v1/problems/{problem_id}/file")
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}/file")
     assert response.status_code == 200
     assert response.content == file_content
     assert response.headers["content-type"].startswith("text/plain")
@@ -108,25 +100,20 @@ def test_download_problem_file(authed_client_with_db):
 def test_upload_problem_invalid_group(authed_client_with_db):
     """Test uploading problem with non-existent group fails"""
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
+        PROBLEMS_URL,
         json={"name": "Invalid Group", "group_ids": [99999]},
     )
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert "not found" in response.json()["detail"]
 
 
-def test_upload_problem_no_file(authed_client_with_db):
+def test_upload_problem_no_file(authed_client_with_db, seeded_group_ids):
     """Test uploading problem without file (self-contained instances)"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
     # Create without file - should succeed (self-contained)
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
+        PROBLEMS_URL,
         json={"name": "Self-Contained Problem", "group_ids": [group_id]},
     )
     assert response.status_code == 201
@@ -137,173 +124,108 @@ def test_upload_problem_no_file(authed_client_with_db):
     assert data["is_instances_self_contained"] is True  # No file provided
 
 
-def test_upload_problem_empty_file(authed_client_with_db):
+def test_upload_problem_empty_file(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test uploading empty file fails"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
     # Create problem
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Empty File", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
+    [problem_id] = arrange_problems({"Empty File": [group_id]})
 
     # Upload empty file
     response = authed_client_with_db.put(
-        f"/api/solverdirector/v1/problems/{problem_id}/file",
-        files={"file": ("empty.txt", BytesIO(b""), "text/plain")},
+        f"{PROBLEMS_URL}/{problem_id}/file",
+        files=_upload("empty.txt", b""),
     )
     assert response.status_code == 422
-    assert "empty" in response.json()["detail"].lower()
+    assert "empty" in response.json()["detail"]
 
 
 def test_get_nonexistent_problem(authed_client_with_db):
     """Test getting non-existent problem returns 404"""
-    response = authed_client_with_db.get("/api/solverdirector/v1/problems/99999")
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}/99999")
     assert response.status_code == 404
 
 
 def test_download_nonexistent_problem(authed_client_with_db):
     """Test downloading non-existent problem returns 404"""
-    response = authed_client_with_db.get("/api/solverdirector/v1/problems/99999/file")
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}/99999/file")
     assert response.status_code == 404
 
 
-def test_download_self_contained_problem(authed_client_with_db):
+def test_download_self_contained_problem(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test downloading self-contained problem (no file) returns 404"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
     # Create problem without file (self-contained)
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Self-Contained", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
+    [problem_id] = arrange_problems({"Self-Contained": [group_id]})
 
     # Try to download - should fail with 404
-    response = authed_client_with_db.get(f"/api/solverdirector/v1/problems/{problem_id}/file")
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}/file")
     assert response.status_code == 404
-    assert "self-contained" in response.json()["detail"].lower()
+    assert "self-contained" in response.json()["detail"]
 
 
 # Validation tests
-def test_upload_problem_empty_name(authed_client_with_db):
-    """Test uploading problem with empty name fails"""
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "", "group_ids": [group_id]},
-    )
+@pytest.mark.parametrize(
+    "payload,loc",
+    [
+        ({"name": "", "group_ids": [1]}, ("name",)),
+        ({"group_ids": [1]}, ("name",)),
+        ({"name": "Test Problem"}, ("group_ids",)),
+        ({"name": "Test Problem", "group_ids": ["not-a-number"]}, ("group_ids", 0)),
+        ({"name": "Empty Groups", "group_ids": []}, ("group_ids",)),
+    ],
+    ids=[
+        "empty-name",
+        "missing-name",
+        "missing-group-ids",
+        "invalid-group-id-type",
+        "empty-group-ids",
+    ],
+)
+def test_problem_create_request_invalid(payload, loc):
+    """Test the create request model rejects an invalid payload"""
+    with pytest.raises(ValidationError) as exc_info:
+        ProblemCreateRequest.model_validate(payload)
+    assert any(err["loc"] == loc for err in exc_info.value.errors())
+
+
+def test_create_problem_empty_name(authed_client):
+    """Test creating a problem with an empty name fails request validation"""
+    response = authed_client.post(PROBLEMS_URL, json={"name": "", "group_ids": [1]})
     assert response.status_code == 422
-    detail = response.json()["detail"]
-    # Detail can be either a string or a list of validation errors
-    if isinstance(detail, list):
-        assert any("name" in str(error).lower() for error in detail)
-    else:
-        assert "name" in detail.lower()
-
-
-def test_upload_problem_whitespace_name(authed_client_with_db):
-    """Test uploading problem with whitespace-only name fails"""
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    assert [error["loc"] for error in response.json()["detail"]] == [["body", "name"]]
 
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "   ", "group_ids": [group_id]},
-    )
-    assert response.status_code == 422
-    detail = response.json()["detail"]
-    # Detail can be either a string or a list of validation errors
-    if isinstance(detail, list):
-        assert any("name" in str(error).lower() for error in detail)
-    else:
-        assert "name" in detail.lower()
-
-
-def test_upload_problem_missing_name(authed_client_with_db):
-    """Test uploading problem without name fails"""
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"group_ids": [group_id]},
-    )
-    assert response.status_code == 422
-
-
-def test_upload_problem_missing_group_id(authed_client_with_db):
-    """Test uploading problem without group_id fails"""
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem"},
-    )
-    assert response.status_code == 422
 
+def test_create_problem_whitespace_name(authed_client):
+    """Test creating a problem with a whitespace-only name fails with 422.
 
-def test_upload_problem_invalid_group_id_type(authed_client_with_db):
-    """Test uploading problem with invalid group_id type fails"""
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": ["not-a-number"]},
-    )
+    Such a name passes the request model and is rejected by the route, so it
+    is only covered here.
+    """
+    response = authed_client.post(PROBLEMS_URL, json={"name": "   ", "group_ids": [1]})
     assert response.status_code == 422
+    assert response.json() == {"detail": "Name cannot be empty"}
 
 
-def test_get_problems_by_group(authed_client_with_db):
+def test_get_problems_by_group(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test getting all problems for a specific group"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
-    # Create two problems
-    problem1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 1", "group_ids": [group_id]},
-    )
-    problem1_id = problem1_response.json()["id"]
-
-    # Upload file for problem 1
-    authed_client_with_db.put(
-        f"/api/solverdirector/v1/problems/{problem1_id}/file",
-        files={"file": ("p1.txt", BytesIO(b"content1"), "text/plain")},
-    )
-
-    # Create problem 2 without file
-    authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 2", "group_ids": [group_id]},
+    # Create two problems, only problem 1 with a file
+    arrange_problems(
+        {"Problem 1": [group_id], "Problem 2": [group_id]},
+        files={"Problem 1": ("p1.txt", b"content1")},
     )
 
     # Get all problems for group
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems?group_id={group_id}"
-    )
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}?group_id={group_id}")
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 2
@@ -315,58 +237,34 @@ def test_get_problems_by_group(authed_client_with_db):
 
 def test_get_problems_nonexistent_group(authed_client_with_db):
     """Test getting problems for non-existent group returns 404"""
-    response = authed_client_with_db.get("/api/solverdirector/v1/problems?group_id=99999")
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}?group_id=99999")
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert "not found" in response.json()["detail"]
 
 
-def test_get_problems_empty_group(authed_client_with_db):
+def test_get_problems_empty_group(authed_client_with_db, seeded_group_ids):
     """Test getting problems for group with no problems returns empty list"""
-    # Create empty group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "empty-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    # Seeded groups have no problems
+    group_id = seeded_group_ids[0]
 
     # Get problems - should be empty
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems?group_id={group_id}"
-    )
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}?group_id={group_id}")
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 0
 
 
-def test_get_problems_filters_by_group(authed_client_with_db):
+def test_get_problems_filters_by_group(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test that problems are correctly filtered by group"""
-    # Create two groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
+    group1_id, group2_id = seeded_group_ids[:2]
 
     # Add problems to both groups
-    authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Group1 Problem", "group_ids": [group1_id]},
-    )
-    authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Group2 Problem", "group_ids": [group2_id]},
-    )
+    arrange_problems({"Group1 Problem": [group1_id], "Group2 Problem": [group2_id]})
 
     # Get problems for group1 - should only have 1
-    response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems?group_id={group1_id}"
-    )
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}?group_id={group1_id}")
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 1
@@ -374,37 +272,21 @@ def test_get_problems_filters_by_group(authed_client_with_db):
     assert data[0]["group_ids"] == [group1_id]
 
 
-def test_get_all_problems(authed_client_with_db):
+def test_get_all_problems(authed_client_with_db, seeded_group_ids, arrange_problems):
     """Test getting all problems without filtering by group"""
-    # Create two groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
+    group1_id, group2_id = seeded_group_ids[:2]
 
     # Add problems to both groups
-    authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Group1 Problem", "group_ids": [group1_id]},
-    )
-    authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Group2 Problem 1", "group_ids": [group2_id]},
-    )
-    authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Group2 Problem 2", "group_ids": [group2_id]},
+    arrange_problems(
+        {
+            "Group1 Problem": [group1_id],
+            "Group2 Problem 1": [group2_id],
+            "Group2 Problem 2": [group2_id],
+        }
     )
 
     # Get all problems without filtering - should have all 3
-    response = authed_client_with_db.get("/api/solverdirector/v1/problems")
+    response = authed_client_with_db.get(PROBLEMS_URL)
     assert response.status_code == 200
     data = response.json()
     assert len(data) == 3
@@ -412,56 +294,34 @@ def test_get_all_problems(authed_client_with_db):
     assert problem_names == {"Group1 Problem", "Group2 Problem 1", "Group2 Problem 2"}
 
 
-def test_upload_duplicate_problem(authed_client_with_db):
+def test_upload_duplicate_problem(authed_client_with_db, seeded_group_ids):
     """Test uploading problem with duplicate name fails"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
     # Create first problem
     response1 = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
+        PROBLEMS_URL,
         json={"name": "Duplicate Problem", "group_ids": [group_id]},
     )
     assert response1.status_code == 201
 
     # Try to create problem with same name - should fail
     response2 = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
+        PROBLEMS_URL,
         json={"name": "Duplicate Problem", "group_ids": [group_id]},
     )
     assert response2.status_code == 400
-    assert "already exists" in response2.json()["detail"].lower()
+    assert "already exists" in response2.json()["detail"]
 
 
 # Many-to-many relationship tests
-def test_upload_problem_with_multiple_groups(authed_client_with_db):
+def test_upload_problem_with_multiple_groups(authed_client_with_db, seeded_group_ids):
     """Test uploading a problem with multiple groups"""
-    # Create three groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
-
-    group3_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group3", "description": "Group 3"},
-    )
-    group3_id = group3_response.json()["id"]
+    group1_id, group2_id, group3_id = seeded_group_ids[:3]
 
     # Create problem with all three groups
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
+        PROBLEMS_URL,
         json={
             "name": "Multi-Group Problem",
             "group_ids": [group1_id, group2_id, group3_id],
@@ -472,8 +332,8 @@ def test_upload_problem_with_multiple_groups(authed_client_with_db):
 
     # Upload file
     file_response = authed_client_with_db.put(
-        f"/api/solverdirector/v1/problems/{problem_id}/file",
-        files={"file": ("test.txt", BytesIO(b"content"), "text/plain")},
+        f"{PROBLEMS_URL}/{problem_id}/file",
+        files=_upload("test.txt"),
     )
 
     assert file_response.status_code == 200
@@ -483,31 +343,20 @@ def test_upload_problem_with_multiple_groups(authed_client_with_db):
 
     # Verify problem appears when querying by each group
     for gid in [group1_id, group2_id, group3_id]:
-        response = authed_client_with_db.get(f"/api/solverdirector/v1/problems?group_id={gid}")
+        response = authed_client_with_db.get(f"{PROBLEMS_URL}?group_id={gid}")
         assert response.status_code == 200
         problems = response.json()
         problem_ids = [p["id"] for p in problems]
         assert problem_id in problem_ids
 
 
-def test_upload_problem_with_duplicate_group_ids(authed_client_with_db):
+def test_upload_problem_with_duplicate_group_ids(authed_client_with_db, seeded_group_ids):
     """Test uploading problem with duplicate group_ids deduplicates them"""
-    # Create two groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
+    group1_id, group2_id = seeded_group_ids[:2]
 
     # Create problem with duplicate group IDs
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
+        PROBLEMS_URL,
         json={
             "name": "Duplicate Groups",
             "group_ids": [group1_id, group1_id, group2_id],
@@ -521,62 +370,31 @@ def test_upload_problem_with_duplicate_group_ids(authed_client_with_db):
     assert len(data["group_ids"]) == 2
 
 
-def test_upload_problem_with_partially_invalid_groups(authed_client_with_db):
+def test_upload_problem_with_partially_invalid_groups(authed_client_with_db, seeded_group_ids):
     """Test uploading problem with some invalid group IDs fails"""
-    # Create one valid group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "valid-group", "description": "Valid"},
-    )
-    group_id = group_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
     # Try to create problem with mix of valid and invalid groups
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
+        PROBLEMS_URL,
         json={"name": "Partial Invalid", "group_ids": [group_id, 99999, 88888]},
     )
 
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert "not found" in response.json()["detail"]
 
 
-def test_upload_problem_with_empty_string_group_ids(authed_client_with_db):
-    """Test uploading problem with empty list group_ids fails"""
-    # Try with empty list
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Empty Groups", "group_ids": []},
-    )
-    assert response.status_code == 422
-
-
-def test_problem_in_multiple_groups_query_filtering(authed_client_with_db):
+def test_problem_in_multiple_groups_query_filtering(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test that problem in multiple groups appears in queries for each group"""
-    # Create two groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
+    group1_id, group2_id = seeded_group_ids[:2]
 
     # Create problem in both groups
-    response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Shared Problem", "group_ids": [group1_id, group2_id]},
-    )
-    assert response.status_code == 201
-    problem_id = response.json()["id"]
+    [problem_id] = arrange_problems({"Shared Problem": [group1_id, group2_id]})
 
     # Query by group1 - should include the problem
-    response1 = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems?group_id={group1_id}"
-    )
+    response1 = authed_client_with_db.get(f"{PROBLEMS_URL}?group_id={group1_id}")
     assert response1.status_code == 200
     problems1 = response1.json()
     assert len(problems1) == 1
@@ -584,9 +402,7 @@ def test_problem_in_multiple_groups_query_filtering(authed_client_with_db):
     assert problems1[0]["name"] == "Shared Problem"
 
     # Query by group2 - should also include the problem
-    response2 = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems?group_id={group2_id}"
-    )
+    response2 = authed_client_with_db.get(f"{PROBLEMS_URL}?group_id={group2_id}")
     assert response2.status_code == 200
     problems2 = response2.json()
     assert len(problems2) == 1
@@ -594,39 +410,24 @@ def test_problem_in_multiple_groups_query_filtering(authed_client_with_db):
     assert problems2[0]["name"] == "Shared Problem"
 
 
-def test_delete_group_keeps_problem(authed_client_with_db):
+def test_delete_group_keeps_problem(authed_client_with_db, seeded_group_ids):
     """Test that deleting a group doesn't delete problems in other groups"""
-    # Create two groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
+    group1_id, group2_id = seeded_group_ids[:2]
 
     # Create problem in both groups
     response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
+        PROBLEMS_URL,
         json={"name": "Persistent Problem", "group_ids": [group1_id, group2_id]},
     )
     assert response.status_code == 201
     problem_id = response.json()["id"]
 
     # Delete group1
-    delete_response = authed_client_with_db.delete(
-        f"/api/solverdirector/v1/groups/{group1_id}"
-    )
+    delete_response = authed_client_with_db.delete(f"{GROUPS_URL}/{group1_id}")
     assert delete_response.status_code == 204
 
     # Problem should still exist
-    problem_response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}"
-    )
+    problem_response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}")
     assert problem_response.status_code == 200
     problem_data = problem_response.json()
     assert problem_data["name"] == "Persistent Problem"
@@ -634,39 +435,19 @@ def test_delete_group_keeps_problem(authed_client_with_db):
     assert problem_data["group_ids"] == [group2_id]
 
 
-def test_get_problem_by_id_with_multiple_groups(authed_client_with_db):
+def test_get_problem_by_id_with_multiple_groups(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test getting problem by ID returns all associated group IDs"""
-    # Create three groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
-
-    group3_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group3", "description": "Group 3"},
-    )
-    group3_id = group3_response.json()["id"]
+    group1_id, group2_id, group3_id = seeded_group_ids[:3]
 
     # Create problem with all three groups
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={
-            "name": "Multi-Group Query Test",
-            "group_ids": [group1_id, group2_id, group3_id],
-        },
+    [problem_id] = arrange_problems(
+        {"Multi-Group Query Test": [group1_id, group2_id, group3_id]}
     )
-    problem_id = create_response.json()["id"]
 
     # Get problem by ID
-    response = authed_client_with_db.get(f"/api/solverdirector/v1/problems/{problem_id}")
+    response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}")
     assert response.status_code == 200
     data = response.json()
     assert data["name"] == "Multi-Group Query Test"
@@ -674,24 +455,18 @@ def test_get_problem_by_id_with_multiple_groups(authed_client_with_db):
 
 
 # PATCH /problems/{id} tests
-def test_update_problem_name_only(authed_client_with_db):
+def test_update_problem_name_only(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test updating only problem name"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    # Create problem
+    group_id = seeded_group_ids[0]
 
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Original Name", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
+    [problem_id] = arrange_problems({"Original Name": [group_id]})
 
     # Update name only
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/problems/{problem_id}",
+        f"{PROBLEMS_URL}/{problem_id}",
         json={"name": "Updated Name"},
     )
     assert update_response.status_code == 200
@@ -700,31 +475,18 @@ def test_update_problem_name_only(authed_client_with_db):
     assert data["group_ids"] == [group_id]  # Groups unchanged
 
 
-def test_update_problem_groups_only(authed_client_with_db):
+def test_update_problem_groups_only(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test updating only problem groups"""
-    # Create two groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
+    group1_id, group2_id = seeded_group_ids[:2]
 
     # Create problem with group1
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group1_id]},
-    )
-    problem_id = create_response.json()["id"]
+    [problem_id] = arrange_problems({"Test Problem": [group1_id]})
 
     # Update to use both groups
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/problems/{problem_id}",
+        f"{PROBLEMS_URL}/{problem_id}",
         json={"group_ids": [group1_id, group2_id]},
     )
     assert update_response.status_code == 200
@@ -733,31 +495,18 @@ def test_update_problem_groups_only(authed_client_with_db):
     assert set(data["group_ids"]) == {group1_id, group2_id}
 
 
-def test_update_problem_both_name_and_groups(authed_client_with_db):
+def test_update_problem_both_name_and_groups(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test updating both name and groups"""
-    # Create two groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
+    group1_id, group2_id = seeded_group_ids[:2]
 
     # Create problem
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Original", "group_ids": [group1_id]},
-    )
-    problem_id = create_response.json()["id"]
+    [problem_id] = arrange_problems({"Original": [group1_id]})
 
     # Update both fields
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/problems/{problem_id}",
+        f"{PROBLEMS_URL}/{problem_id}",
         json={"name": "Updated", "group_ids": [group2_id]},
     )
     assert update_response.status_code == 200
@@ -766,131 +515,80 @@ def test_update_problem_both_name_and_groups(authed_client_with_db):
     assert data["group_ids"] == [group2_id]
 
 
-def test_update_problem_empty_name(authed_client_with_db):
-    """Test updating with empty name fails"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+@pytest.mark.parametrize(
+    "payload,detail",
+    [
+        ({"name": "   "}, None),
+        ({"group_ids": []}, None),
+        ({}, "At least one field must be provided for update"),
+    ],
+    ids=["whitespace-name", "empty-group-ids", "no-fields"],
+)
+def test_update_problem_invalid(
+    authed_client_with_db, seeded_group_ids, arrange_problems, payload, detail
+):
+    """Test updating a problem with an invalid payload fails"""
+    [problem_id] = arrange_problems({"Original": [seeded_group_ids[0]]})
 
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Original", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
-
-    # Try to update with empty name
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/problems/{problem_id}",
-        json={"name": "   "},
+        f"{PROBLEMS_URL}/{problem_id}",
+        json=payload,
     )
     assert update_response.status_code == 422
+    if detail is not None:
+        assert update_response.json()["detail"] == detail
 
 
-def test_update_problem_duplicate_name(authed_client_with_db):
+def test_update_problem_duplicate_name(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test updating to duplicate name fails"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
     # Create two problems
-    authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 1", "group_ids": [group_id]},
+    _, problem2_id = arrange_problems(
+        {"Problem 1": [group_id], "Problem 2": [group_id]}
     )
 
-    create_response2 = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem 2", "group_ids": [group_id]},
-    )
-    problem2_id = create_response2.json()["id"]
-
     # Try to update problem 2 to have same name as problem 1
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/problems/{problem2_id}",
+        f"{PROBLEMS_URL}/{problem2_id}",
         json={"name": "Problem 1"},
     )
     assert update_response.status_code == 400
     assert "already exists" in update_response.json()["detail"]
 
 
-def test_update_problem_nonexistent_groups(authed_client_with_db):
+def test_update_problem_nonexistent_groups(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test updating with non-existent groups fails"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    # Create problem
+    group_id = seeded_group_ids[0]
 
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
+    [problem_id] = arrange_problems({"Test Problem": [group_id]})
 
     # Try to update with non-existent group
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/problems/{problem_id}",
+        f"{PROBLEMS_URL}/{problem_id}",
         json={"group_ids": [group_id, 99999]},
     )
     assert update_response.status_code == 404
     assert "99999" in update_response.json()["detail"]
 
 
-def test_update_problem_empty_group_ids(authed_client_with_db):
-    """Test updating with empty group_ids list fails"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
-
-    # Try to update with empty group_ids
-    update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/problems/{problem_id}",
-        json={"group_ids": []},
-    )
-    assert update_response.status_code == 422
-
-
-def test_update_problem_duplicate_group_ids(authed_client_with_db):
+def test_update_problem_duplicate_group_ids(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test updating with duplicate group_ids deduplicates them"""
-    # Create two groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
+    group1_id, group2_id = seeded_group_ids[:2]
 
     # Create problem
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group1_id]},
-    )
-    problem_id = create_response.json()["id"]
+    [problem_id] = arrange_problems({"Test Problem": [group1_id]})
 
     # Update with duplicate group_ids
     update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/problems/{problem_id}",
+        f"{PROBLEMS_URL}/{problem_id}",
         json={"group_ids": [group1_id, group2_id, group1_id, group2_id]},
     )
     assert update_response.status_code == 200
@@ -903,200 +601,115 @@ def test_update_problem_duplicate_group_ids(authed_client_with_db):
 def test_update_nonexistent_problem(authed_client_with_db):
     """Test updating non-existent problem fails"""
     update_response = authed_client_with_db.patch(
-        "/api/solverdirector/v1/problems/99999",
+        f"{PROBLEMS_URL}/99999",
         json={"name": "New Name"},
     )
     assert update_response.status_code == 404
-    assert "not found" in update_response.json()["detail"].lower()
-
-
-def test_update_problem_no_fields(authed_client_with_db):
-    """Test updating with no fields fails"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Test Problem", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
-
-    # Try to update with no fields
-    update_response = authed_client_with_db.patch(
-        f"/api/solverdirector/v1/problems/{problem_id}",
-        json={},
-    )
-    assert update_response.status_code == 422
-    assert "at least one field" in update_response.json()["detail"].lower()
+    assert "not found" in update_response.json()["detail"]
 
 
 # DELETE /problems/{id} tests
-def test_delete_problem_success(authed_client_with_db):
+def test_delete_problem_success(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test successfully deleting a problem"""
-    # Create group and problem
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    # Create problem
+    group_id = seeded_group_ids[0]
 
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem to Delete", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
+    [problem_id] = arrange_problems({"Problem to Delete": [group_id]})
 
     # Delete problem
-    delete_response = authed_client_with_db.delete(
-        f"/api/solverdirector/v1/problems/{problem_id}"
-    )
+    delete_response = authed_client_with_db.delete(f"{PROBLEMS_URL}/{problem_id}")
     assert delete_response.status_code == 204
 
     # Verify problem no longer exists
-    get_response = authed_client_with_db.get(f"/api/solverdirector/v1/problems/{problem_id}")
+    get_response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}")
     assert get_response.status_code == 404
 
 
-def test_delete_problem_with_instances(authed_client_with_db):
+def test_delete_problem_with_instances(
+    authed_client_with_db, seeded_group_ids, arrange_problems, arrange_instances
+):
     """Test deleting a problem with instances (cascade delete)"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
     # Create problem with file
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem with Instances", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
-
-    # Upload file
-    file_content = b"problem content"
-    authed_client_with_db.put(
-        f"/api/solverdirector/v1/problems/{problem_id}/file",
-        files={"file": ("problem.mzn", BytesIO(file_content), "text/plain")},
-    )
-
-    # Upload instances
-    instance1_content = b"instance 1"
-    instance1_response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances",
-        files={"file": ("instance1.dzn", BytesIO(instance1_content), "text/plain")},
+    [problem_id] = arrange_problems(
+        {"Problem with Instances": [group_id]},
+        files={"Problem with Instances": ("problem.mzn", b"problem content")},
     )
-    _ = instance1_response.json()["id"]
 
-    instance2_content = b"instance 2"
-    instance2_response = authed_client_with_db.post(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances",
-        files={"file": ("instance2.dzn", BytesIO(instance2_content), "text/plain")},
+    # Add instances
+    arrange_instances(
+        problem_id, {"instance1.dzn": b"instance 1", "instance2.dzn": b"instance 2"}
     )
-    _ = instance2_response.json()["id"]
 
     # Delete problem
-    delete_response = authed_client_with_db.delete(
-        f"/api/solverdirector/v1/problems/{problem_id}"
-    )
+    delete_response = authed_client_with_db.delete(f"{PROBLEMS_URL}/{problem_id}")
     assert delete_response.status_code == 204
 
     # Verify problem no longer exists
-    get_problem_response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}"
-    )
+    get_problem_response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}")
     assert get_problem_response.status_code == 404
 
     # Verify instances are also deleted
     get_instances_response = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}/instances"
+        f"{PROBLEMS_URL}/{problem_id}/instances"
     )
     assert get_instances_response.status_code == 404
 
 
-def test_delete_problem_with_multiple_groups(authed_client_with_db):
+def test_delete_problem_with_multiple_groups(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test deleting a problem in multiple groups (groups should remain)"""
-    # Create two groups
-    group1_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group1", "description": "Group 1"},
-    )
-    group1_id = group1_response.json()["id"]
-
-    group2_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "group2", "description": "Group 2"},
-    )
-    group2_id = group2_response.json()["id"]
+    group1_id, group2_id = seeded_group_ids[:2]
 
     # Create problem in both groups
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Multi-Group Problem", "group_ids": [group1_id, group2_id]},
-    )
-    problem_id = create_response.json()["id"]
+    [problem_id] = arrange_problems({"Multi-Group Problem": [group1_id, group2_id]})
 
     # Delete problem
-    delete_response = authed_client_with_db.delete(
-        f"/api/solverdirector/v1/problems/{problem_id}"
-    )
+    delete_response = authed_client_with_db.delete(f"{PROBLEMS_URL}/{problem_id}")
     assert delete_response.status_code == 204
 
     # Verify groups still exist
-    group1_get = authed_client_with_db.get(f"/api/solverdirector/v1/groups/{group1_id}")
+    group1_get = authed_client_with_db.get(f"{GROUPS_URL}/{group1_id}")
     assert group1_get.status_code == 200
 
-    group2_get = authed_client_with_db.get(f"/api/solverdirector/v1/groups/{group2_id}")
+    group2_get = authed_client_with_db.get(f"{GROUPS_URL}/{group2_id}")
     assert group2_get.status_code == 200
 
 
 def test_delete_nonexistent_problem(authed_client_with_db):
     """Test deleting a non-existent problem returns 404"""
-    delete_response = authed_client_with_db.delete("/api/solverdirector/v1/problems/99999")
+    delete_response = authed_client_with_db.delete(f"{PROBLEMS_URL}/99999")
     assert delete_response.status_code == 404
-    assert "not found" in delete_response.json()["detail"].lower()
+    assert "not found" in delete_response.json()["detail"]
 
 
-def test_delete_problem_with_file(authed_client_with_db):
+def test_delete_problem_with_file(
+    authed_client_with_db, seeded_group_ids, arrange_problems
+):
     """Test deleting a problem with uploaded file"""
-    # Create group
-    group_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/groups",
-        json={"name": "test-group", "description": "Test"},
-    )
-    group_id = group_response.json()["id"]
-
-    # Create problem
-    create_response = authed_client_with_db.post(
-        "/api/solverdirector/v1/problems",
-        json={"name": "Problem with File", "group_ids": [group_id]},
-    )
-    problem_id = create_response.json()["id"]
+    group_id = seeded_group_ids[0]
 
-    # Upload file
-    file_content = b"This is the problem file content"
-    authed_client_with_db.put(
-        f"/api/solverdirector/v1/problems/{problem_id}/file",
-        files={"file": ("problem.mzn", BytesIO(file_content), "text/plain")},
+    # Create problem with a file
+    [problem_id] = arrange_problems(
+        {"Problem with File": [group_id]},
+        files={
+            "Problem with File": ("problem.mzn", b"This is the problem file content")
+        },
     )
 
-    # Verify file was uploaded
-    get_response = authed_client_with_db.get(f"/api/solverdirector/v1/problems/{problem_id}")
+    # Verify file was stored
+    get_response = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}")
     assert get_response.status_code == 200
     assert get_response.json()["filename"] == "problem.mzn"
 
     # Delete problem
-    delete_response = authed_client_with_db.delete(
-        f"/api/solverdirector/v1/problems/{problem_id}"
-    )
+    delete_response = authed_client_with_db.delete(f"{PROBLEMS_URL}/{problem_id}")
     assert delete_response.status_code == 204
 
     # Verify problem and file are gone
-    get_after_delete = authed_client_with_db.get(
-        f"/api/solverdirector/v1/problems/{problem_id}"
-    )
+    get_after_delete = authed_client_with_db.get(f"{PROBLEMS_URL}/{problem_id}")
     assert get_after_delete.status_code == 404
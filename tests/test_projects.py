@@ -4,6 +4,7 @@ import uuid
 from unittest.mock import patch, MagicMock
 from psp_auth.testing import MockToken, MockUser
 from src.models import ResourceDefaults, UserResourceConfig, Project as ProjectModel
+from src.spawner.status_service import UserLimitReachedError
 
 # Test data
 VALID_CONFIG = {
@@ -46,6 +47,11 @@ VALID_CONFIG_MULTI_GROUP = {
 }
 
 
+def validation_errors(response):
+    """The (type, loc) pairs of a 422 response's validation errors"""
+    return {(error["type"], tuple(error["loc"])) for error in response.json()["detail"]}
+
+
 def test_create_project(client_with_db, auth):
     """Test creating a new project with valid configuration"""
     mock_user = MockUser(id="test-user-123")
@@ -56,7 +62,7 @@ def test_create_project(client_with_db, auth):
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
 
-        assert response.status_code == 201
+        assert response.status_code == 202
         data = response.json()
         assert data["user_id"] == mock_user.id
         assert data["name"] == "Test Project"
@@ -154,18 +160,72 @@ def test_get_nonexistent_project_status(client_with_db, auth):
 
 
 def test_create_project_solver_controller_failure(client_with_db, auth):
-    """Test that project creation fails if solver controller fails to start"""
-    token = auth.issue_token(MockToken(scopes=["projects:write"]))
-    with patch("src.routers.api.projects.start_project_services") as mock_start:
+    """Test that a project whose services fail to start reports the failure"""
+    token = auth.issue_token(MockToken(scopes=["projects:write", "projects:read"]))
+    with (
+        patch("src.routers.api.projects.start_project_services") as mock_start,
+        patch("src.routers.api.projects.drain_queue") as mock_drain,
+    ):
         mock_start.side_effect = Exception("Failed to start solver controller")
 
         response = client_with_db.post(
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
 
-        # Should return 500 with generic error message
-        assert response.status_code == 500
-        assert response.json()["detail"] == "Unable to create project"
+        # Services are started after the response, so creation itself succeeds
+        assert response.status_code == 202
+
+    # Its resources are released, so queued projects get a chance to start
+    mock_drain.assert_called_once()
+
+    status_response = client_with_db.get(
+        f"/v1/projects/{response.json()['id']}/status",
+        headers=auth.auth_header(token),
+    )
+    assert status_response.status_code == 200
+    assert status_response.json()["status"] == {
+        "isFinished": True,
+        "error": "Unable to start project services",
+    }
+
+
+def test_create_project_user_limit_reached_while_starting(client_with_db, auth):
+    """Test that losing the spawn limit race after acceptance is reported"""
+    token = auth.issue_token(MockToken(scopes=["projects:write", "projects:read"]))
+    with (
+        patch("src.routers.api.projects.start_project_services") as mock_start,
+        patch("src.routers.api.projects.drain_queue"),
+    ):
+        mock_start.side_effect = UserLimitReachedError("limit reached")
+
+        response = client_with_db.post(
+            "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
+        )
+        assert response.status_code == 202
+
+    status_response = client_with_db.get(
+        f"/v1/projects/{response.json()['id']}/status",
+        headers=auth.auth_header(token),
+    )
+    assert status_response.json()["status"] == {
+        "isFinished": True,
+        "error": "limit reached",
+    }
+
+
+def test_create_project_user_limit_reached(client_with_db, auth):
+    """Test that the concurrent spawn limit is enforced before accepting a project"""
+    token = auth.issue_token(MockToken(scopes=["projects:write"]))
+    with (
+        patch("src.routers.api.projects.is_user_limit_reached", return_value=True),
+        patch("src.routers.api.projects.start_project_services") as mock_start,
+    ):
+        response = client_with_db.post(
+            "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
+        )
+
+    assert response.status_code == 429
+    mock_start.assert_not_called()
 
 
 def test_get_project_status_connection_error(client_with_db, auth):
@@ -189,7 +249,7 @@ def test_get_project_status_connection_error(client_with_db, auth):
                 headers=auth.auth_header(read_token),
             )
             assert response.status_code == 503
-            assert "unavailable" in response.json()["detail"].lower()
+            assert response.json()["detail"] == "Project status temporarily unavailable"
 
 
 # DELETE /projects/{project_id} tests
@@ -275,7 +335,7 @@ def test_create_project_with_multiple_problem_groups(client_with_db, auth):
             headers=auth.auth_header(token),
         )
 
-        assert response.status_code == 201
+        assert response.status_code == 202
         data = response.json()
         assert data["name"] == "Multi-Group Project"
         assert isinstance(data["id"], str)
@@ -289,8 +349,10 @@ def test_create_project_missing_configuration(client_with_db, auth):
     )
 
     assert response.status_code == 422
-    detail = str(response.json()).lower()
-    assert "problem_groups" in detail or "name" in detail
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["body", field]
+        for field in ["name", "timeout", "problem_groups", "vcpus", "memory_gib"]
+    ]
 
 
 def test_create_project_empty_configuration(client_with_db, auth):
@@ -303,8 +365,7 @@ def test_create_project_empty_configuration(client_with_db, auth):
     )
 
     assert response.status_code == 422
-    detail = str(response.json()).lower()
-    assert "at least 1" in detail or "min_length" in detail
+    assert validation_errors(response) >= {("too_short", ("body", "problem_groups"))}
 
 
 def test_create_project_invalid_problem_group(client_with_db, auth):
@@ -326,8 +387,9 @@ def test_create_project_invalid_problem_group(client_with_db, auth):
     )
 
     assert response.status_code == 422
-    detail = str(response.json()).lower()
-    assert "greater than 0" in detail or "gt=0" in detail
+    assert validation_errors(response) >= {
+        ("greater_than", ("body", "problem_groups", 0, "problem_group"))
+    }
 
 
 def test_create_project_empty_solvers(client_with_db, auth):
@@ -351,7 +413,7 @@ def test_create_project_empty_solvers(client_with_db, auth):
 
         # Solvers are in extras which is optional/flexible, so this might succeed
         # Just check we get a valid response code
-        assert response.status_code in [201, 422]
+        assert response.status_code in [202, 422]
 
 
 def test_create_project_empty_instances(client_with_db, auth):
@@ -373,8 +435,9 @@ def test_create_project_empty_instances(client_with_db, auth):
     )
 
     assert response.status_code == 422
-    detail = str(response.json()).lower()
-    assert "at least 1" in detail or "min_length" in detail
+    assert validation_errors(response) >= {
+        ("too_short", ("body", "problem_groups", 0, "problems", 0, "instances"))
+    }
 
 
 def test_get_project_config(client_with_db, auth):
@@ -415,25 +478,6 @@ def test_get_nonexistent_project_config(client_with_db, auth):
     assert response.json()["detail"] == "Invalid user or project"
 
 
-# def test_get_project_solution_not_implemented(client_with_db, auth):
-#     """Test getting project solution returns 501"""
-#     write_token = auth.issue_token(MockToken(scopes=["projects:write"]))
-#     read_token = auth.issue_token(MockToken(scopes=["projects:read"]))
-#     with patch("src.routers.api.projects.start_project_services"):
-#         # Create project
-#         create_response = client_with_db.post(
-#             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(write_token)
-#         )
-#         project_id = create_response.json()["id"]
-
-#         # Get solution (not implemented yet)
-#         response = client_with_db.get(
-#             f"/v1/projects/{project_id}/solution", headers=auth.auth_header(read_token)
-#         )
-#         assert response.status_code == 501
-#         assert "not yet implemented" in response.json()["detail"].lower()
-
-
 def test_get_nonexistent_project_solution(client_with_db, auth):
     """Test getting solution for non-existent project returns 404"""
     token = auth.issue_token(MockToken(scopes=["projects:read"]))
@@ -695,7 +739,7 @@ def test_project_response_includes_is_queued(client_with_db, auth, test_db):
         response = client_with_db.post(
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
-    assert response.status_code == 201
+    assert response.status_code == 202
     assert "is_queued" in response.json()
 
 
@@ -708,7 +752,7 @@ def test_project_starts_when_resources_available(client_with_db, auth, test_db):
         response = client_with_db.post(
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
-    assert response.status_code == 201
+    assert response.status_code == 202
     assert response.json()["is_queued"] is False
     mock_start.assert_called_once()
 
@@ -732,7 +776,7 @@ def test_project_queued_when_queue_non_empty(client_with_db, auth, test_db):
         response = client_with_db.post(
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
-    assert response.status_code == 201
+    assert response.status_code == 202
     assert response.json()["is_queued"] is True
     mock_start.assert_not_called()
 
@@ -757,7 +801,7 @@ def test_project_queued_when_global_cpu_exceeded(client_with_db, auth, test_db):
         response = client_with_db.post(
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
-    assert response.status_code == 201
+    assert response.status_code == 202
     assert response.json()["is_queued"] is True
     mock_start.assert_not_called()
 
@@ -781,7 +825,7 @@ def test_project_queued_when_global_memory_exceeded(client_with_db, auth, test_d
         response = client_with_db.post(
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
-    assert response.status_code == 201
+    assert response.status_code == 202
     assert response.json()["is_queued"] is True
     mock_start.assert_not_called()
 
@@ -806,7 +850,7 @@ def test_project_queued_when_per_user_cpu_exceeded(client_with_db, auth, test_db
         response = client_with_db.post(
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
-    assert response.status_code == 201
+    assert response.status_code == 202
     assert response.json()["is_queued"] is True
     mock_start.assert_not_called()
 
@@ -831,7 +875,7 @@ def test_project_queued_when_per_user_memory_exceeded(client_with_db, auth, test
         response = client_with_db.post(
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
-    assert response.status_code == 201
+    assert response.status_code == 202
     assert response.json()["is_queued"] is True
     mock_start.assert_not_called()
 
@@ -930,6 +974,6 @@ def test_project_starts_despite_other_user_at_per_user_cap(client_with_db, auth,
         response = client_with_db.post(
             "/v1/projects", json=VALID_CONFIG, headers=auth.auth_header(token)
         )
-    assert response.status_code == 201
+    assert response.status_code == 202
     assert response.json()["is_queued"] is False
     mock_start.assert_called_once()
@@ -0,0 +1,64 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from pika.exceptions import AMQPConnectionError, StreamLostError
+
+from src.spawner import publisher
+
+
+@pytest.fixture(autouse=True)
+def reset_connection():
+    publisher._reset()
+    yield
+    publisher._reset()
+
+
+def _connection():
+    connection = MagicMock()
+    connection.is_open = True
+    connection.is_closed = False
+    connection.channel.return_value.is_closed = False
+    return connection
+
+
+def test_publish_reuses_connection():
+    connection = _connection()
+    with patch("src.spawner.publisher.pika.BlockingConnection", return_value=connection) as connect:
+        publisher.publish("queue-a", b"one")
+        publisher.publish("queue-a", b"two")
+
+    connect.assert_called_once()
+    channel = connection.channel.return_value
+    assert channel.basic_publish.call_count == 2
+    assert channel.basic_publish.call_args.kwargs["body"] == b"two"
+
+
+def test_channel_uses_publisher_confirms():
+    connection = _connection()
+    with patch("src.spawner.publisher.pika.BlockingConnection", return_value=connection):
+        publisher.publish("queue-a", b"one")
+        publisher.publish("queue-a", b"two")
+
+    connection.channel.return_value.confirm_delivery.assert_called_once()
+
+
+def test_publish_reconnects_after_connection_loss():
+    lost, fresh = _connection(), _connection()
+    lost.channel.return_value.basic_publish.side_effect = StreamLostError("lost")
+    with patch(
+        "src.spawner.publisher.pika.BlockingConnection", side_effect=[lost, fresh]
+    ):
+        publisher.publish("queue-a", b"body")
+
+    fresh.channel.return_value.basic_publish.assert_called_once()
+
+
+def test_publish_raises_when_reconnect_fails():
+    connection = _connection()
+    with patch(
+        "src.spawner.publisher.pika.BlockingConnection",
+        side_effect=[connection, AMQPConnectionError("refused")],
+    ):
+        connection.channel.return_value.basic_publish.side_effect = StreamLostError("lost")
+        with pytest.raises(AMQPConnectionError):
+            publisher.publish("queue-a", b"body")
@@ -0,0 +1,135 @@
+import asyncio
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.spawner.result_collector import flush_results
+
+
+def _result(project_id, instance_id=1, **extra):
+    return {
+        "project_id": project_id,
+        "problem_id": 1,
+        "instance_id": instance_id,
+        "solver_id": 1,
+        "vcpus": 1,
+        "result": {"status": "SATISFIED"},
+        **extra,
+    }
+
+
+def _message():
+    message = MagicMock()
+    message.ack = AsyncMock()
+    return message
+
+
+def _flush(db, pending):
+    # Every save opens its own session, which is db here
+    with patch("src.spawner.result_collector.SessionLocal", return_value=db):
+        asyncio.run(flush_results(MagicMock(), "results", pending))
+
+
+def test_flush_saves_batch_with_one_commit():
+    db = MagicMock()
+    project_id = str(uuid.uuid4())
+    first, last = _message(), _message()
+
+    _flush(db, [(first, _result(project_id, 1)), (last, _result(project_id, 2))])
+
+    assert db.add.call_count == 2
+    db.commit.assert_called_once()
+    db.close.assert_called_once()
+    first.ack.assert_awaited_once_with()
+    last.ack.assert_awaited_once_with()
+
+
+class _Broker:
+    """Tracks unacked delivery tags and rejects acks of unknown ones, like
+    RabbitMQ does by closing the channel with PRECONDITION_FAILED.
+    """
+
+    def __init__(self):
+        self.unacked = set()
+
+    def deliver(self, tag):
+        self.unacked.add(tag)
+        message = MagicMock()
+
+        async def ack(multiple=False):
+            if tag not in self.unacked:
+                raise RuntimeError(f"PRECONDITION_FAILED - unknown delivery tag {tag}")
+            acked = {t for t in self.unacked if t <= tag} if multiple else {tag}
+            self.unacked -= acked
+
+        message.ack = ack
+        return message
+
+
+def test_flush_leaves_unparsable_message_in_window_to_be_acked():
+    broker = _Broker()
+    project_id = str(uuid.uuid4())
+    good1, bad, good2 = broker.deliver(1), broker.deliver(2), broker.deliver(3)
+
+    # The unparsable message is still being routed to retry while the batch
+    # holding the messages around it is flushed
+    _flush(
+        MagicMock(),
+        [(good1, _result(project_id, 1)), (good2, _result(project_id, 2))],
+    )
+    assert broker.unacked == {2}
+
+    asyncio.run(bad.ack())
+    assert broker.unacked == set()
+
+
+def test_flush_falls_back_to_single_saves_when_batch_fails():
+    db = MagicMock()
+    # Batch commit fails, then the good message saves and the bad one fails again
+    db.commit.side_effect = [Exception("boom"), None, Exception("boom")]
+    project_id = str(uuid.uuid4())
+    good, bad = _message(), _message()
+
+    with patch(
+        "src.spawner.result_collector.retry_or_dlq", new_callable=AsyncMock
+    ) as mock_retry:
+        _flush(db, [(good, _result(project_id, 1)), (bad, _result(project_id, 2))])
+
+    good.ack.assert_awaited_once_with()
+    bad.ack.assert_not_called()
+    mock_retry.assert_awaited_once()
+    assert mock_retry.await_args.args[2] is bad
+
+
+def test_flush_acks_results_for_deleted_projects():
+    db = MagicMock()
+    db.commit.side_effect = Exception(
+        'violates foreign key constraint "project_results_project_id_fkey"'
+    )
+    message = _message()
+
+    with patch(
+        "src.spawner.result_collector.retry_or_dlq", new_callable=AsyncMock
+    ) as mock_retry:
+        _flush(db, [(message, _result(str(uuid.uuid4())))])
+
+    message.ack.assert_awaited_once_with()
+    mock_retry.assert_not_called()
+
+
+def test_final_message_completes_project_and_drains_queue():
+    db = MagicMock()
+    project = MagicMock(is_complete=False)
+    db.query.return_value.filter.return_value.first.return_value = project
+    project_id = str(uuid.uuid4())
+    message = _message()
+
+    with (
+        patch("src.spawner.result_collector.stop_solver_controller") as mock_stop,
+        patch("src.spawner.result_collector.drain_queue") as mock_drain,
+    ):
+        _flush(db, [(message, _result(project_id, final_message=True))])
+
+    mock_stop.assert_called_once_with(project_id)
+    mock_drain.assert_called_once_with(db)
+    assert project.is_complete is True
+    message.ack.assert_awaited_once_with()
@@ -0,0 +1,69 @@
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client.rest import ApiException
+from pika.exceptions import AMQPConnectionError
+
+from src.spawner.retry import retry_transient
+
+
+pytestmark = pytest.mark.usefixtures("retry_sleep")
+
+
+def mock_call(side_effect):
+    call = MagicMock(side_effect=side_effect)
+    call.__name__ = "call"
+    return call
+
+
+@pytest.mark.parametrize(
+    "error", [ApiException(status=503), ApiException(status=429), AMQPConnectionError()]
+)
+def test_transient_errors_are_retried(error):
+    call = mock_call([error, "ok"])
+
+    assert retry_transient()(call)() == "ok"
+    assert call.call_count == 2
+
+
+def test_client_errors_are_not_retried():
+    call = mock_call(ApiException(status=409))
+
+    with pytest.raises(ApiException):
+        retry_transient()(call)()
+    call.assert_called_once()
+
+
+def test_missing_default_service_account_is_retried():
+    error = ApiException(status=403)
+    error.body = 'error looking up service account p/default: "default" not found'
+    call = mock_call([error, "ok"])
+
+    assert retry_transient()(call)() == "ok"
+
+
+def test_forbidden_is_not_retried():
+    error = ApiException(status=403)
+    error.body = 'pods is forbidden: User "director" cannot create resource "pods"'
+    call = mock_call(error)
+
+    with pytest.raises(ApiException):
+        retry_transient()(call)()
+    call.assert_called_once()
+
+
+def test_gives_up_after_last_attempt(retry_sleep):
+    call = mock_call(ApiException(status=500))
+
+    with pytest.raises(ApiException):
+        retry_transient(attempts=3)(call)()
+    assert call.call_count == 3
+    assert retry_sleep.call_count == 2
+
+
+def test_backoff_is_capped(retry_sleep):
+    call = mock_call([ApiException(status=500)] * 5 + ["ok"])
+
+    retry_transient(attempts=6, base_delay=1, max_delay=4)(call)()
+
+    assert all(0 <= c.args[0] <= 4 for c in retry_sleep.call_args_list)
@@ -0,0 +1,166 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from src.schemas import ProjectConfiguration
+from src.spawner.start_service import start_project_services
+
+PROJECT_CONFIG = ProjectConfiguration(
+    name="project",
+    timeout=60,
+    vcpus=2,
+    memory_gib=4.0,
+    problem_groups=[
+        {
+            "problem_group": 1,
+            "problems": [{"problem": 1, "instances": [1]}],
+            "extras": {"solvers": [1]},
+        }
+    ],
+)
+
+
+@pytest.fixture
+def kube(retry_sleep):
+    api_client = MagicMock()
+    with (
+        patch("src.spawner.start_service.api_client", return_value=api_client),
+        patch("src.spawner.start_service.publish") as publish,
+        patch("src.spawner.start_service.stop_solver_controller") as stop,
+    ):
+        yield api_client, publish, stop
+
+
+def applied_paths(api_client):
+    return {c.args[0] for c in api_client.call_api.call_args_list}
+
+
+def test_applies_all_project_resources(kube):
+    api_client, _, _ = kube
+
+    start_project_services(PROJECT_CONFIG, "project-1", "user-a")
+
+    assert applied_paths(api_client) == {
+        "/api/v1/namespaces/project-1",
+        "/api/v1/namespaces/project-1-solvers",
+        "/apis/rbac.authorization.k8s.io/v1/namespaces/project-1-solvers/roles/solver-creator",
+        "/apis/rbac.authorization.k8s.io/v1/namespaces/project-1-solvers/rolebindings/solver-creator-binding",
+        "/api/v1/namespaces/project-1-solvers/resourcequotas/solver-quota",
+        "/api/v1/namespaces/project-1-solvers/secrets/psp-auth-client",
+        "/api/v1/namespaces/project-1/secrets/psp-auth-client",
+        "/api/v1/namespaces/project-1/pods/solver-controller",
+        "/api/v1/namespaces/project-1/services/solver-controller",
+        "/api/v1/namespaces/project-1/pods/data-gatherer",
+        "/api/v1/namespaces/project-1/services/data-gatherer",
+    }
+
+
+def test_resources_are_server_side_applied(kube):
+    api_client, _, _ = kube
+
+    start_project_services(PROJECT_CONFIG, "project-1", "user-a")
+
+    for c in api_client.call_api.call_args_list:
+        assert c.args[1] == "PATCH"
+        assert c.kwargs["header_params"]["Content-Type"] == "application/apply-patch+yaml"
+        assert ("fieldManager", "solver-director") in c.kwargs["query_params"]
+        assert ("force", "true") in c.kwargs["query_params"]
+
+
+def test_namespace_failure_stops_before_other_resources(kube):
+    api_client, _, stop = kube
+    api_client.call_api.side_effect = ApiException(status=500)
+
+    with pytest.raises(ApiException):
+        start_project_services(PROJECT_CONFIG, "project-1", "user-a")
+
+    assert applied_paths(api_client) == {
+        "/api/v1/namespaces/project-1",
+        "/api/v1/namespaces/project-1-solvers",
+    }
+    stop.assert_called_once_with("project-1")
+
+
+def test_resource_failure_is_raised_after_other_applies_finish(kube):
+    api_client, publish, stop = kube
+
+    def call_api(path, method, **kwargs):
+        if "/services/" in path:
+            raise ApiException(status=500)
+
+    api_client.call_api.side_effect = call_api
+
+    with pytest.raises(ApiException):
+        start_project_services(PROJECT_CONFIG, "project-1", "user-a")
+
+    assert len([p for p in applied_paths(api_client) if "/secrets/" in p]) == 2
+    assert not [p for p in applied_paths(api_client) if "/pods/" in p]
+    publish.assert_not_called()
+    stop.assert_called_once_with("project-1")
+
+
+def test_pods_are_applied_after_the_resources_they_depend_on(kube):
+    api_client, _, _ = kube
+
+    start_project_services(PROJECT_CONFIG, "project-1", "user-a")
+
+    paths = [c.args[0] for c in api_client.call_api.call_args_list]
+    first_pod = min(i for i, p in enumerate(paths) if "/pods/" in p)
+    assert all("/pods/" in p for p in paths[first_pod:])
+
+
+def test_pod_waits_for_default_service_account(kube):
+    api_client, publish, stop = kube
+    missing_account = ApiException(status=403)
+    missing_account.body = (
+        'pods "data-gatherer" is forbidden: error looking up service account '
+        'project-1/default: serviceaccount "default" not found'
+    )
+    failures = iter([missing_account])
+
+    def call_api(path, method, **kwargs):
+        if path.endswith("/pods/data-gatherer"):
+            error = next(failures, None)
+            if error is not None:
+                raise error
+
+    api_client.call_api.side_effect = call_api
+
+    start_project_services(PROJECT_CONFIG, "project-1", "user-a")
+
+    publish.assert_called_once()
+    stop.assert_not_called()
+
+
+def test_publishes_problem_groups_to_director_queue(kube):
+    _, publish, stop = kube
+
+    start_project_services(PROJECT_CONFIG, "project-1", "user-a")
+
+    queue, body = publish.call_args.args
+    assert queue == "project-project-1-director"
+    assert json.loads(body) == {
+        "problem_groups": PROJECT_CONFIG.model_dump()["problem_groups"]
+    }
+    stop.assert_not_called()
+
+
+def test_publish_failure_tears_project_down(kube):
+    _, publish, stop = kube
+    publish.side_effect = RuntimeError("broker down")
+
+    with pytest.raises(RuntimeError):
+        start_project_services(PROJECT_CONFIG, "project-1", "user-a")
+
+    stop.assert_called_once_with("project-1")
+
+
+def test_cleanup_failure_keeps_original_error(kube):
+    _, publish, stop = kube
+    publish.side_effect = RuntimeError("broker down")
+    stop.side_effect = RuntimeError("apiserver down")
+
+    with pytest.raises(RuntimeError, match="broker down"):
+        start_project_services(PROJECT_CONFIG, "project-1", "user-a")
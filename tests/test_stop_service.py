@@ -0,0 +1,47 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from src.spawner.stop_service import stop_solver_controller
+
+
+@pytest.fixture
+def kube(retry_sleep):
+    core = MagicMock()
+    with (
+        patch("src.spawner.stop_service.core_v1", return_value=core),
+        patch("src.spawner.stop_service.delete_project_queues") as delete_queues,
+    ):
+        yield core, delete_queues
+
+
+def test_deletes_both_namespaces_in_background(kube):
+    core, delete_queues = kube
+
+    stop_solver_controller("project-1")
+
+    deleted = {c.args[0] for c in core.delete_namespace.call_args_list}
+    assert deleted == {"project-1", "project-1-solvers"}
+    for c in core.delete_namespace.call_args_list:
+        assert c.kwargs["propagation_policy"] == "Background"
+    delete_queues.assert_called_once_with("project-1")
+
+
+def test_missing_namespaces_are_ignored(kube):
+    core, delete_queues = kube
+    core.delete_namespace.side_effect = ApiException(status=404)
+
+    stop_solver_controller("project-1")
+
+    delete_queues.assert_called_once_with("project-1")
+
+
+def test_delete_failure_is_raised(kube):
+    core, delete_queues = kube
+    core.delete_namespace.side_effect = ApiException(status=403)
+
+    with pytest.raises(ApiException):
+        stop_solver_controller("project-1")
+
+    delete_queues.assert_not_called()
@@ -0,0 +1,10 @@
+from src.utils import project_names
+
+
+def test_project_names():
+    names = project_names("project-1")
+
+    assert names.solvers_namespace == "project-1-solvers"
+    assert names.control_queue == "project-project-1-controller"
+    assert names.result_queue == "project-project-1-result"
+    assert names.director_queue == "project-project-1-director"